@@ -5,6 +5,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Query
 from typing import Optional
+import copy
 import hashlib
 import json
 import logging
@@ -85,12 +86,26 @@ def _content_config_path() -> Path:
     return ROOT / "config.content.yaml"
 
 
+# Parsed config.content.yaml, keyed on the file's (mtime_ns, size)
+_content_config_cache: Optional[tuple[tuple[int, int], dict]] = None
+
+
 def _load_content_config() -> dict:
+    """
+    Parse config.content.yaml, re-reading only when the file changed on disk.
+    Callers edit and save the result, so each gets its own deep copy.
+    """
+    global _content_config_cache
     path = _content_config_path()
-    if not path.exists():
+    try:
+        st = path.stat()
+    except FileNotFoundError:
         return {}
-    with open(path) as f:
-        return yaml.safe_load(f) or {}
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _content_config_cache is None or _content_config_cache[0] != stamp:
+        with open(path) as f:
+            _content_config_cache = (stamp, yaml.safe_load(f) or {})
+    return copy.deepcopy(_content_config_cache[1])
 
 
 def _save_content_config(data: dict):
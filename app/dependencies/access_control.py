@@ -38,23 +38,28 @@ Optionally inspect the stage without hard-blocking::
 
 Log extra body args from a POST handler (one explicit call per protected POST)::
 
-    from app.dependencies.access_control import log_usage
+    from app.dependencies.access_control import log_usage_deferred
 
-    log_usage(conn, token_info.id, request.url.path, input_args=tool_request)
+    log_usage_deferred(token_info.id, request.url.path, input_args=tool_request)
 """
 
+import atexit
 import fnmatch
 import hashlib
 import json
 import logging
+import queue
 import re
+import threading
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import List, Optional
 
+import orjson
 from fastapi import Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 
-from db.models import get_db, DB_PATH
+from db.models import acquire_db, release_db, DB_PATH
 
 logger = logging.getLogger(__name__)
 
@@ -124,11 +129,11 @@ class TokenInfo:
 
 def _get_db_conn():
     """Scoped DB connection for access-control dependency."""
-    conn = get_db(DB_PATH)
+    conn = acquire_db(DB_PATH)
     try:
         yield conn
     finally:
-        conn.close()
+        release_db(conn, DB_PATH)
 
 
 def _validate_token(conn, token_value: str) -> Optional[TokenInfo]:
@@ -142,7 +147,8 @@ def _validate_token(conn, token_value: str) -> Optional[TokenInfo]:
     """
     now = datetime.now(timezone.utc)
 
-    # ── 1. Check regular tokens table (hashed lookup, with plaintext fallback)
+    # ── 1. Check regular tokens table (hashed lookup, with plaintext fallback
+    #       for legacy un-hashed tokens) — one query, hashed match preferred
     token_hash = hashlib.sha256(token_value.encode()).hexdigest()
     row = conn.execute(
         """
@@ -150,24 +156,13 @@ def _validate_token(conn, token_value: str) -> Optional[TokenInfo]:
                tier, max_tokens_per_session, max_calls_per_day,
                max_input_chars, max_output_chars
         FROM tokens
-        WHERE token_value = ?
+        WHERE token_value IN (?, ?)
+        ORDER BY token_value = ? DESC
+        LIMIT 1
         """,
-        (token_hash,),
+        (token_hash, token_value, token_hash),
     ).fetchone()
 
-    # Fallback: try plaintext lookup for legacy un-hashed tokens
-    if not row:
-        row = conn.execute(
-            """
-            SELECT id, owner_name, expires_at, is_active,
-                   tier, max_tokens_per_session, max_calls_per_day,
-                   max_input_chars, max_output_chars
-            FROM tokens
-            WHERE token_value = ?
-            """,
-            (token_value,),
-        ).fetchone()
-
     if row:
         if not row["is_active"]:
             return None
@@ -201,8 +196,7 @@ def _validate_token(conn, token_value: str) -> Optional[TokenInfo]:
             max_output_chars=row["max_output_chars"],
         )
 
-    # ── 2. Check derived tokens table (token stored as SHA-256 hash) ─────────
-    hashed = hashlib.sha256(token_value.encode()).hexdigest()
+    # ── 2. Check derived tokens table (same SHA-256 hash as above) ──────────
     drow = conn.execute(
         """
         SELECT d.id, d.parent_token_id, d.scope, d.expires_at, d.is_active,
@@ -211,7 +205,7 @@ def _validate_token(conn, token_value: str) -> Optional[TokenInfo]:
         JOIN tokens t ON t.id = d.parent_token_id
         WHERE d.token_value = ?
         """,
-        (hashed,),
+        (token_hash,),
     ).fetchone()
 
     if not drow:
@@ -250,6 +244,22 @@ def _validate_token(conn, token_value: str) -> Optional[TokenInfo]:
     )
 
 
+_SQL_INSERT_USAGE = """
+    INSERT INTO usage_logs (token_id, endpoint_called, timestamp, input_args)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+def _encode_args(input_args: Optional[dict]) -> Optional[str]:
+    """JSON-encode logged args with orjson; stdlib json for what it rejects."""
+    if input_args is None:
+        return None
+    try:
+        return orjson.dumps(input_args, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:  # e.g. integers beyond 64 bits
+        return json.dumps(input_args, ensure_ascii=False, default=str)
+
+
 def log_usage(
     conn,
     token_id: int,
@@ -262,23 +272,105 @@ def log_usage(
     Call this from route handlers to attach body args (e.g. POST tool calls).
     The ``require_private_access`` dependency already logs the basic endpoint
     hit; this function is only needed when you also want to record the parsed
-    request body.
+    request body. Request handlers should prefer ``log_usage_deferred``.
     """
     conn.execute(
-        """
-        INSERT INTO usage_logs (token_id, endpoint_called, timestamp, input_args)
-        VALUES (?, ?, ?, ?)
-        """,
-        (
-            token_id,
-            endpoint,
-            datetime.now(timezone.utc).isoformat(),
-            json.dumps(input_args, ensure_ascii=False) if input_args is not None else None,
-        ),
+        _SQL_INSERT_USAGE,
+        (token_id, endpoint, datetime.now(timezone.utc).isoformat(), _encode_args(input_args)),
     )
     conn.commit()
 
 
+# One writer thread drains queued usage rows and commits them in batches
+# (one transaction per drained batch), off the request path and in order.
+# The queue is bounded: if the writer falls behind, the oldest rows are dropped.
+_USAGE_BATCH_MAX = 50
+_USAGE_QUEUE_MAX = 10000
+_usage_queue: queue.Queue = queue.Queue(maxsize=_USAGE_QUEUE_MAX)
+
+
+def _enqueue_usage(row: Optional[tuple]) -> None:
+    """Queue a usage row (or the shutdown sentinel), dropping the oldest when full."""
+    while True:
+        try:
+            _usage_queue.put_nowait(row)
+            return
+        except queue.Full:
+            try:
+                _usage_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _write_usage_batch(batch: list) -> None:
+    conn = acquire_db(DB_PATH)
+    try:
+        conn.executemany(_SQL_INSERT_USAGE, batch)
+        conn.commit()
+    except Exception:
+        # One bad row (e.g. its token was deleted while queued) must not
+        # cost the whole batch: retry row by row, dropping only failures
+        conn.rollback()
+        for row in batch:
+            try:
+                conn.execute(_SQL_INSERT_USAGE, row)
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.warning("Failed to log usage for token %s on %s: %s", row[0], row[1], e)
+    finally:
+        release_db(conn, DB_PATH)
+
+
+def _usage_writer() -> None:
+    running = True
+    while running:
+        batch = [_usage_queue.get()]
+        while len(batch) < _USAGE_BATCH_MAX:
+            try:
+                batch.append(_usage_queue.get_nowait())
+            except queue.Empty:
+                break
+        if None in batch:  # shutdown sentinel: write what is queued, then stop
+            running = False
+            batch = [row for row in batch if row is not None]
+            if not batch:
+                break
+        try:
+            _write_usage_batch(batch)
+        except Exception as e:
+            # e.g. the connection could not be opened: drop this batch but
+            # keep the writer alive for the next one
+            logger.warning("Failed to log %d usage row(s): %s", len(batch), e)
+
+
+_usage_thread = threading.Thread(target=_usage_writer, name="usage-log", daemon=True)
+_usage_thread.start()
+
+
+@atexit.register
+def _flush_usage() -> None:
+    _enqueue_usage(None)
+    _usage_thread.join(timeout=5)
+
+
+def log_usage_deferred(
+    token_id: int,
+    endpoint: str,
+    input_args: Optional[dict] = None,
+) -> None:
+    """
+    Queue a ``usage_logs`` row for the background writer and return at once.
+    Timestamp and args are captured now, so rows keep request-time values.
+    """
+    _enqueue_usage((
+        token_id,
+        endpoint,
+        datetime.now(timezone.utc).isoformat(),
+        _encode_args(input_args),
+    ))
+
+
 # ── Token extraction ──────────────────────────────────────────────────────────
 
 def _extract_raw_token(request: Request) -> Optional[str]:
@@ -347,8 +439,13 @@ class _AccessGate:
                 )
             return None  # Anonymous stage — caller handles gracefully
 
-        # ── Token provided — validate ────────────────────────────────────────
-        token_info = _validate_token(conn, raw_token)
+        # ── Token provided — validate (once per request) ─────────────────────
+        validated = getattr(request.state, "_validated_token", None)
+        if validated and validated[0] == raw_token:
+            token_info = validated[1]
+        else:
+            token_info = _validate_token(conn, raw_token)
+            request.state._validated_token = (raw_token, token_info)
         if not token_info:
             raise HTTPException(
                 status_code=403,
@@ -359,12 +456,9 @@ class _AccessGate:
             )
 
         # ── Log the access (query params captured; body args logged separately) ─
-        try:
-            qp = dict(request.query_params)
-            qp.pop("token", None)  # Strip the token itself from logged args
-            log_usage(conn, token_info.id, request.url.path, qp or None)
-        except Exception:
-            pass  # Never let logging failure block the actual request
+        qp = dict(request.query_params)
+        qp.pop("token", None)  # Strip the token itself from logged args
+        log_usage_deferred(token_info.id, request.url.path, qp or None)
 
         return token_info
 
@@ -400,6 +494,25 @@ def _forbidden_json(stage: str, message: str):
     )
 
 
+def _validate_and_log(raw_token: str, path: str, qp: dict) -> Optional[TokenInfo]:
+    """
+    Blocking part of the endpoint guard: validate the token and log the
+    access. Run in the threadpool so SQLite I/O stays off the event loop.
+    """
+    conn = acquire_db(DB_PATH)
+    try:
+        token_info = _validate_token(conn, raw_token)
+    finally:
+        release_db(conn, DB_PATH)
+    if not token_info:
+        return None
+
+    # Log the access — the only logging point for routes that have no
+    # require_mcp_access dependency (most routes in main.py).
+    log_usage_deferred(token_info.id, path, qp or None)
+    return token_info
+
+
 def build_endpoint_guard(protected_config: dict):
     """
     Build an async HTTP middleware function that enforces config-driven access
@@ -440,25 +553,15 @@ def build_endpoint_guard(protected_config: dict):
                 ),
             )
 
-        conn = get_db(DB_PATH)
-        try:
-            token_info = _validate_token(conn, raw_token)
-
-            if not token_info:
-                return _forbidden_json(
-                    STAGE_ANONYMOUS,
-                    "Access Restricted: token is invalid, expired, or revoked.",
-                )
-
-            # Log the access — the only logging point for routes that have no
-            # require_mcp_access dependency (most routes in main.py).
-            try:
-                qp = {k: v for k, v in request.query_params.items() if k != "token"}
-                log_usage(conn, token_info.id, path, qp or None)
-            except Exception:
-                pass
-        finally:
-            conn.close()
+        qp = {k: v for k, v in request.query_params.items() if k != "token"}
+        token_info = await run_in_threadpool(_validate_and_log, raw_token, path, qp)
+        # Route-level gates reuse this result instead of querying again
+        request.state._validated_token = (raw_token, token_info)
+        if not token_info:
+            return _forbidden_json(
+                STAGE_ANONYMOUS,
+                "Access Restricted: token is invalid, expired, or revoked.",
+            )
 
         response = await call_next(request)
 
@@ -0,0 +1,76 @@
+"""
+app/i18n.py — Language Negotiation & Translation Overlay
+========================================================
+
+Shared by the REST API (app.main) and the MCP router (app.routers.mcp).
+Kept in a leaf module so both can import it at load time without a cycle.
+
+  resolve_lang()    → ?lang= > Accept-Language > DEFAULT_LANG
+  _localise()       → overlay one entity's stored translation
+  _localise_many()  → same for a list of entities
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from db.models import (
+    get_translation, get_translations, apply_translation,
+    SUPPORTED_LANGS, DEFAULT_LANG,
+)
+
+
+LANG_LABELS = {"en": "English", "de": "Deutsch"}
+
+
+@lru_cache(maxsize=256)
+def resolve_lang(lang_param: Optional[str], accept_language: Optional[str]) -> str:
+    """
+    Priority: ?lang= > Accept-Language header > DEFAULT_LANG.
+    Falls back silently for unsupported codes.
+    Pure function of its inputs, so results are memoised (bounded LRU).
+    """
+    for candidate in (lang_param, _best_accept_lang(accept_language)):
+        if candidate and candidate.lower() in SUPPORTED_LANGS:
+            return candidate.lower()
+    return DEFAULT_LANG
+
+
+@lru_cache(maxsize=256)
+def _best_accept_lang(header: Optional[str]) -> Optional[str]:
+    """Parse 'de-DE,de;q=0.9,en;q=0.8' → highest-weighted supported lang."""
+    if not header:
+        return None
+    best_lang, best_q = None, -1.0
+    for part in header.replace(" ", "").split(","):
+        tag_q = part.split(";")
+        tag = tag_q[0].split("-")[0].lower()
+        q = 1.0
+        if len(tag_q) > 1 and tag_q[1].startswith("q="):
+            try:
+                q = float(tag_q[1][2:])
+            except ValueError:
+                pass
+        if tag in SUPPORTED_LANGS and q > best_q:
+            best_lang, best_q = tag, q
+    return best_lang
+
+
+def _localise(conn, entity: dict, lang: str) -> dict:
+    """Overlay stored translation. Skips technology/person (names are universal)."""
+    if lang == DEFAULT_LANG or entity.get("type") in ("technology", "person"):
+        return entity
+    translation = get_translation(conn, entity["id"], lang)
+    if not translation:
+        return entity
+    return apply_translation(entity, translation)
+
+
+def _localise_many(conn, entities: list, lang: str) -> list:
+    """_localise() for a list, with all translations loaded in one query."""
+    if lang == DEFAULT_LANG or not entities:
+        return entities
+    translations = get_translations(conn, [e["id"] for e in entities], lang)
+    for entity in entities:
+        if entity.get("type") not in ("technology", "person"):
+            apply_translation(entity, translations.get(entity["id"]))
+    return entities
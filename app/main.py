@@ -51,30 +51,33 @@ Routes:
   GET /health                    → liveness check
 """
 
-import json
+import hashlib
+import orjson
 import os
+import sqlite3
 import subprocess
 import sys
 import time
 import yaml
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
-from fastapi import FastAPI, HTTPException, Query, Request, Depends, Header
+from fastapi import FastAPI, HTTPException, Query, Request, Response, Depends, Header
 from fastapi.middleware.cors import CORSMiddleware
 from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import ORJSONResponse, HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from db.models import (
-    DB_PATH, get_db, init_db,
-    get_entity, list_entities,
+    DB_PATH, acquire_db, release_db, init_db, get_cache_epoch,
+    get_entity, get_entity_flavor, list_entities,
     list_all_tags,
-    get_translation, get_greeting_translation,
+    get_translations, get_greeting_translation,
     apply_translation, SUPPORTED_LANGS, DEFAULT_LANG,
     query_skills, query_skill_detail,
     query_technologies, query_technology_detail,
@@ -87,6 +90,7 @@ from db.models import (
     query_technologies_with_metrics,
 )
 
+from app.i18n import LANG_LABELS, resolve_lang, _localise, _localise_many
 from app.session_tracker import SessionTracker
 from app.routers import mcp, internal
 from app.dependencies.access_control import require_private_access, TokenInfo, build_endpoint_guard
@@ -110,6 +114,18 @@ def load_prompts():
 
 CONFIG = load_config()
 PROMPTS = load_prompts()
+# Prompt templates are static: index them and build the /prompts listing once
+PROMPTS_BY_ID = {p["id"]: p for p in PROMPTS}
+PROMPTS_SUMMARY = [
+    {
+        "id": p["id"],
+        "name": p["name"],
+        "description": p["description"],
+        "use_case": p["use_case"],
+        "url": f"/prompts/{p['id']}"
+    }
+    for p in PROMPTS
+]
 APP_VERSION = "2.2.0"
 
 # Base URL for templates and documentation
@@ -130,7 +146,8 @@ if session_cfg.get("enabled", True):
         timeout_hours=session_cfg.get("timeout_hours", 5.0),
         log_file=session_cfg.get("log_file", "logs/api_access.log"),
         db_path=session_cfg.get("db_path", "db/sessions.db"),
-        relevant_endpoints=session_cfg.get("relevant_endpoints", {})
+        relevant_endpoints=session_cfg.get("relevant_endpoints", {}),
+        ignored_endpoints=session_cfg.get("ignored_endpoints", [])
     )
 else:
     session_tracker = None
@@ -153,6 +170,21 @@ def _rate_limit_key(request: Request) -> str:
 limiter = Limiter(key_func=_rate_limit_key, default_limits=["120/minute"])
 
 
+async def _db_unavailable_handler(request: Request, exc: sqlite3.OperationalError):
+    """A locked or busy database is transient: answer 503 and ask to retry."""
+    message = str(exc)
+    if "locked" not in message and "busy" not in message:
+        return ORJSONResponse(
+            status_code=500,
+            content={"status": "error", "error": {"code": 500, "message": "Database error"}},
+        )
+    return ORJSONResponse(
+        status_code=503,
+        content={"status": "error", "error": {"code": 503, "message": "Database temporarily unavailable"}},
+        headers={"Retry-After": "1"},
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db(DB_PATH)
@@ -166,10 +198,12 @@ app = FastAPI(
     lifespan=lifespan,
     docs_url="/docs",
     redoc_url=None,
+    default_response_class=ORJSONResponse,
 )
 
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+app.add_exception_handler(sqlite3.OperationalError, _db_unavailable_handler)
 
 # Security settings from config (with safe defaults)
 _security_cfg = CONFIG.get("security", {})
@@ -229,9 +263,6 @@ async def session_tracking_middleware(request: Request, call_next):
     endpoint = request.url.path
     method = request.method
     
-    # Extract query params for pagination detection
-    query_params = dict(request.query_params) if request.query_params else None
-    
     # Track request if enabled
     coverage_meta = None
     if session_tracker:
@@ -240,7 +271,9 @@ async def session_tracking_middleware(request: Request, call_next):
             user_agent=user_agent,
             endpoint=endpoint,
             method=method,
-            query_params=query_params
+            # Raw query string for pagination detection; the tracker only
+            # scans it for offset/page/skip/limit
+            raw_query=request.url.query
         )
     
     # Process request
@@ -264,9 +297,6 @@ async def session_tracking_middleware(request: Request, call_next):
 # SHARED HELPERS
 # ─────────────────────────────────────────────────────────────────────────────
 
-LANG_LABELS = {"en": "English", "de": "Deutsch"}
-
-
 def ok(data: Any, meta: dict = None) -> dict:
     resp = {"status": "success", "data": data}
     if meta:
@@ -274,72 +304,125 @@ def ok(data: Any, meta: dict = None) -> dict:
     return resp
 
 
-def err(msg: str, code: int = 400) -> JSONResponse:
-    return JSONResponse(
+def err(msg: str, code: int = 400) -> ORJSONResponse:
+    return ORJSONResponse(
         status_code=code,
         content={"status": "error", "error": {"code": code, "message": msg}},
     )
 
 
 def db():
-    conn = get_db(DB_PATH)
+    conn = acquire_db(DB_PATH)
     try:
         yield conn
     finally:
-        conn.close()
+        release_db(conn, DB_PATH)
+
+
+LIST_MAX_AGE = 60
+
+
+def http_cache(request: Request, response: Response, conn=Depends(db)) -> None:
+    """
+    Conditional-GET support for list endpoints.
+
+    The ETag is derived from the content epoch (bumped by DB triggers on every
+    write) plus everything else the response depends on, so it can be checked
+    before any query runs. A matching If-None-Match short-circuits with 304.
+    Token-bearing requests are marked private so shared caches never keep them.
+    """
+    key = "|".join((
+        APP_VERSION,
+        str(get_cache_epoch(conn)),
+        request.url.path,
+        str(request.query_params),
+        request.headers.get("accept-language", ""),
+    ))
+    etag = f'"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+    scope = "private" if request.headers.get("authorization") or "token" in request.query_params else "public"
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"{scope}, max-age={LIST_MAX_AGE}",
+        "Vary": "Accept-Language, Authorization",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(","))):
+        raise HTTPException(304, headers=headers)
+    response.headers.update(headers)
+    request.state.cache_headers = headers  # for handlers returning their own Response
 
 
 # ─────────────────────────────────────────────────────────────────────────────
-# LANGUAGE NEGOTIATION
+# SHARED PARAMETER TYPES  (declared once, reused by every handler)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def resolve_lang(lang_param: Optional[str], accept_language: Optional[str]) -> str:
+LangQuery           = Annotated[Optional[str], Query(description="en | de")]
+AcceptLang          = Annotated[Optional[str], Header(alias="Accept-Language")]
+
+# Categories follow the configured sources (e.g. coding, certification under
+# stages), so they stay free-form
+StageCategoryQuery  = Annotated[Optional[str], Query(description="Filter by category: education | job | achievement | certification | coding")]
+OeuvreCategoryQuery = Annotated[Optional[str], Query(description="Filter by category: coding | blog_post | article | book | website")]
+TagFilterQuery      = Annotated[Optional[str], Query(description="Filter by generic tag")]
+SkillFilterQuery    = Annotated[Optional[str], Query(description="Filter by skill tag")]
+TechFilterQuery     = Annotated[Optional[str], Query(description="Filter by technology tag")]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# LOCALISATION (negotiation and per-entity overlay live in app.i18n)
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _localise_detail(conn, detail: dict, lang: str) -> dict:
     """
-    Priority: ?lang= > Accept-Language header > DEFAULT_LANG.
-    Falls back silently for unsupported codes.
+    Localise a *_detail payload in place. `entities` and the `by_flavor`
+    buckets share the same dicts, so translations are loaded in one query
+    for the union of ids and every entity dict is overlaid exactly once.
     """
-    for candidate in (lang_param, _best_accept_lang(accept_language)):
-        if candidate and candidate.lower() in SUPPORTED_LANGS:
-            return candidate.lower()
-    return DEFAULT_LANG
-
-
-def _best_accept_lang(header: Optional[str]) -> Optional[str]:
-    """Parse 'de-DE,de;q=0.9,en;q=0.8' → highest-weighted supported lang."""
-    if not header:
-        return None
-    best_lang, best_q = None, -1.0
-    for part in header.replace(" ", "").split(","):
-        tag_q = part.split(";")
-        tag = tag_q[0].split("-")[0].lower()
-        q = 1.0
-        if len(tag_q) > 1 and tag_q[1].startswith("q="):
-            try:
-                q = float(tag_q[1][2:])
-            except ValueError:
-                pass
-        if tag in SUPPORTED_LANGS and q > best_q:
-            best_lang, best_q = tag, q
-    return best_lang
-
-
-def _localise(conn, entity: dict, lang: str) -> dict:
-    """Overlay stored translation. Skips technology/person (names are universal)."""
-    if lang == DEFAULT_LANG or entity.get("type") in ("technology", "person"):
-        return entity
-    translation = get_translation(conn, entity["id"], lang)
-    if not translation:
-        return entity
-    return apply_translation(entity, translation)
-
-
-def _localise_many(conn, entities: list, lang: str) -> list:
     if lang == DEFAULT_LANG:
-        return entities
-    return [_localise(conn, e, lang) for e in entities]
+        return detail
+    unique = {
+        id(e): e
+        for bucket in (detail["entities"], *detail["by_flavor"].values())
+        for e in bucket
+    }
+    translations = get_translations(conn, {e["id"] for e in unique.values()}, lang)
+    for entity in unique.values():
+        if entity.get("type") not in ("technology", "person"):
+            apply_translation(entity, translations.get(entity["id"]))
+    return detail
 
 
+def _stream_ok(request: Request, conn, key: str, entities: list, lang: str) -> StreamingResponse:
+    """
+    Stream ok({key: entities, "count": n}, meta=_lang_meta(lang)) entity by
+    entity. Translations are loaded in one query up front; each entity is then
+    localised and orjson-encoded as it is written, so the whole JSON document
+    is never held in memory and the first bytes go out immediately.
+    """
+    translations = (
+        get_translations(conn, [e["id"] for e in entities], lang)
+        if lang != DEFAULT_LANG else {}
+    )
+
+    def body():
+        yield b'{"status":"success","data":{' + orjson.dumps(key) + b":["
+        for i, entity in enumerate(entities):
+            if entity.get("type") not in ("technology", "person"):
+                apply_translation(entity, translations.get(entity["id"]))
+            yield (b"," if i else b"") + orjson.dumps(entity)
+        yield b'],"count":%d},"meta":%s}' % (len(entities), orjson.dumps(_lang_meta(lang)))
+
+    return StreamingResponse(
+        body(),
+        media_type="application/json",
+        headers=getattr(request.state, "cache_headers", None),
+    )
+
+
+@lru_cache(maxsize=256)
 def _lang_meta(lang: str) -> dict:
+    # Memoised: the returned dict is shared — callers must not mutate it
     return {"lang": lang, "lang_label": LANG_LABELS.get(lang, lang)}
 
 
@@ -447,7 +530,7 @@ async def index(request: Request):
         "entity_types":   ENTITY_META,
         "relation_types": RELATION_META,
     }
-    return JSONResponse(content=ok(data), media_type="application/json")
+    return ORJSONResponse(content=ok(data))
 
 
 @app.get("/human", response_class=HTMLResponse)
@@ -465,8 +548,6 @@ async def human_endpoint(request: Request):
 
 
 @app.get("/index", summary="MCP discovery root")
-@app.get("/root", summary="Discovery root (alias for /index)", include_in_schema=False)
-@app.get("/discover", summary="Discovery endpoint (alias for /index)", include_in_schema=False)
 @limiter.limit("120/minute")
 async def index_endpoint(request: Request, conn=Depends(db)):
     """
@@ -537,6 +618,13 @@ async def index_endpoint(request: Request, conn=Depends(db)):
         }
     })
 
+
+# Aliases reuse the same (rate-limited) handler object via a single registration each
+for _alias, _summary in (("/root", "Discovery root (alias for /index)"),
+                         ("/discover", "Discovery endpoint (alias for /index)")):
+    app.add_api_route(_alias, index_endpoint, methods=["GET"], summary=_summary, include_in_schema=False)
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "ts": time.time(), "version": APP_VERSION}
@@ -558,19 +646,9 @@ async def list_prompts(request: Request):
     
     Use GET /prompts/{prompt_id} to retrieve the full template.
     """
-    prompts_summary = [
-        {
-            "id": p["id"],
-            "name": p["name"],
-            "description": p["description"],
-            "use_case": p["use_case"],
-            "url": f"/prompts/{p['id']}"
-        }
-        for p in PROMPTS
-    ]
     return ok({
-        "prompts": prompts_summary,
-        "count": len(prompts_summary)
+        "prompts": PROMPTS_SUMMARY,
+        "count": len(PROMPTS_SUMMARY)
     })
 
 
@@ -595,7 +673,7 @@ async def get_prompt(
 
     This template can be directly used by LLMs or adapted by users for their needs.
     """
-    prompt = next((p for p in PROMPTS if p["id"] == prompt_id), None)
+    prompt = PROMPTS_BY_ID.get(prompt_id)
     if not prompt:
         raise HTTPException(404, f"Prompt '{prompt_id}' not found")
 
@@ -603,8 +681,6 @@ async def get_prompt(
 
 
 @app.get("/schema", summary="MCP data model schema")
-@app.get("/openapi.json", summary="OpenAPI schema (alias for /schema)", include_in_schema=False)
-@app.get("/model", summary="Data model (alias for /schema)", include_in_schema=False)
 @limiter.limit("120/minute")
 async def schema(request: Request):
     """
@@ -956,6 +1032,11 @@ async def schema(request: Request):
     })
 
 
+for _alias, _summary in (("/openapi.json", "OpenAPI schema (alias for /schema)"),
+                         ("/model", "Data model (alias for /schema)")):
+    app.add_api_route(_alias, schema, methods=["GET"], summary=_summary, include_in_schema=False)
+
+
 @app.get("/coverage", summary="Session coverage report")
 @limiter.limit("200/minute")
 async def coverage_report(request: Request, conn=Depends(db)):
@@ -1043,7 +1124,7 @@ async def coverage_report(request: Request, conn=Depends(db)):
         }
     }
     
-    return JSONResponse(content=ok(response), media_type="application/json")
+    return ORJSONResponse(content=ok(response))
 
 
 # ── Language coverage ─────────────────────────────────────────────────────────
@@ -1091,8 +1172,8 @@ async def languages(request: Request, conn=Depends(db)):
 async def greeting(
     request: Request,
     conn=Depends(db),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """
     Returns the profile owner's identity card from identity entities.
@@ -1164,7 +1245,7 @@ async def greeting(
 
 # ── Categories ────────────────────────────────────────────────────────────────
 
-@app.get("/categories", summary="Entity flavors + counts")
+@app.get("/categories", summary="Entity flavors + counts", dependencies=[Depends(http_cache)])
 @limiter.limit("120/minute")
 async def categories(request: Request, conn=Depends(db)):
     rows = conn.execute("""
@@ -1187,7 +1268,7 @@ async def categories(request: Request, conn=Depends(db)):
 
 # ── Entities list ─────────────────────────────────────────────────────────────
 
-@app.get("/entities", summary="List entities (paginated, translated)")
+@app.get("/entities", summary="List entities (paginated, translated)", dependencies=[Depends(http_cache)])
 @limiter.limit("120/minute")
 async def entities_list(
     request: Request,
@@ -1199,8 +1280,8 @@ async def entities_list(
     search: Optional[str]          = Query(None, description="Full-text search"),
     limit: int                     = Query(20, ge=1, le=100),
     offset: int                    = Query(0, ge=0),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     resolved  = resolve_lang(lang, accept_language)
     tag_list  = [t.strip() for t in tags.split(",")] if tags else None
@@ -1240,8 +1321,8 @@ async def entity_detail(
     entity_id: str,
     conn=Depends(db),
     include_relations: bool        = Query(True),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """Full entity detail + typed extension + graph relations, all localised."""
     resolved = resolve_lang(lang, accept_language)
@@ -1269,8 +1350,8 @@ async def entity_related(
     conn=Depends(db),
     rel_type: Optional[str]        = Query(None, description="Filter by relation type"),
     direction: str                  = Query("both", pattern="^(in|out|both)$"),
-    lang: Optional[str]            = Query(None),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     resolved = resolve_lang(lang, accept_language)
 
@@ -1286,7 +1367,7 @@ async def entity_related(
 
 # ── Category ──────────────────────────────────────────────────────────────────
 
-@app.get("/category/{entity_flavor}", summary="Entities by flavor (translated)")
+@app.get("/category/{entity_flavor}", summary="Entities by flavor (translated)", dependencies=[Depends(http_cache)])
 @limiter.limit("120/minute")
 async def category(
     request: Request,
@@ -1297,8 +1378,8 @@ async def category(
     search: Optional[str]          = Query(None),
     limit: int                     = Query(50, ge=1, le=100),
     offset: int                    = Query(0, ge=0),
-    lang: Optional[str]            = Query(None),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     resolved = resolve_lang(lang, accept_language)
     tag_list = [t.strip() for t in tags.split(",")] if tags else None
@@ -1322,7 +1403,7 @@ async def category(
 
 # ── Tags ──────────────────────────────────────────────────────────────────────
 
-@app.get("/tags", summary="All tags + counts")
+@app.get("/tags", summary="All tags + counts", dependencies=[Depends(http_cache)])
 @limiter.limit("120/minute")
 async def tags_route(request: Request, conn=Depends(db)):
     all_tags = list_all_tags(conn)
@@ -1335,8 +1416,8 @@ async def tag_detail(
     request: Request,
     tag_name: str,
     conn=Depends(db),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """
     Returns all entities that have a specific generic tag.
@@ -1347,9 +1428,7 @@ async def tag_detail(
     detail = query_tag_detail(conn, tag_name)
     if not detail["entities"]:
         return err(f"Tag '{tag_name}' not found or has no entities", 404)
-    detail["entities"] = _localise_many(conn, detail["entities"], resolved)
-    for key in detail["by_flavor"]:
-        detail["by_flavor"][key] = _localise_many(conn, detail["by_flavor"][key], resolved)
+    _localise_detail(conn, detail, resolved)
     return ok(detail, meta=_lang_meta(resolved))
 
 
@@ -1363,8 +1442,8 @@ async def search(
     q: str                         = Query(..., min_length=2),
     type: Optional[str]            = Query(None),
     limit: int                     = Query(20, ge=1, le=50),
-    lang: Optional[str]            = Query(None),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """Searches base (English) text; returns results localised into requested lang."""
     resolved  = resolve_lang(lang, accept_language)
@@ -1417,13 +1496,13 @@ async def graph(
 
 # ── Skills ────────────────────────────────────────────────────────────────────
 
-@app.get("/skills", summary="All skills with entity counts and metrics")
+@app.get("/skills", summary="All skills with entity counts and metrics", dependencies=[Depends(http_cache)])
 @limiter.limit("120/minute")
 async def skills_list(
     request: Request,
     conn=Depends(db),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
     order_by: Optional[str]        = Query("relevance_score", description="Sort by: relevance_score | proficiency | entity_count | experience_years"),
     limit: int                     = Query(100, description="Maximum results"),
 ):
@@ -1459,8 +1538,8 @@ async def skill_detail(
     request: Request,
     skill_name: str,
     conn=Depends(db),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """
     Returns all entities (jobs, projects, articles, education entries) that
@@ -1472,9 +1551,7 @@ async def skill_detail(
     detail = query_skill_detail(conn, skill_name)
     if not detail["entities"]:
         return err(f"No entities found with skill '{skill_name}'", 404)
-    detail["entities"] = _localise_many(conn, detail["entities"], resolved)
-    for key in detail["by_flavor"]:
-        detail["by_flavor"][key] = _localise_many(conn, detail["by_flavor"][key], resolved)
+    _localise_detail(conn, detail, resolved)
     
     # Add metrics
     metrics = get_tag_metrics(conn, skill_name, "skill")
@@ -1486,8 +1563,7 @@ async def skill_detail(
 
 # ── Technology ───────────────────────────────────────────────────────────────
 
-@app.get("/technology", summary="All technologies with entity counts and metrics")
-@app.get("/technologies", summary="Technologies list (alias for /technology)", include_in_schema=False)
+@app.get("/technology", summary="All technologies with entity counts and metrics", dependencies=[Depends(http_cache)])
 @limiter.limit("120/minute")
 async def technologies_list(
     request: Request,
@@ -1517,14 +1593,21 @@ async def technologies_list(
     return ok({"technologies": technologies, "count": len(technologies)})
 
 
+app.add_api_route(
+    "/technologies", technologies_list, methods=["GET"],
+    summary="Technologies list (alias for /technology)", include_in_schema=False,
+    dependencies=[Depends(http_cache)],
+)
+
+
 @app.get("/technology/{tech_name}", summary="Entities that used a technology with metrics")
 @limiter.limit("120/minute")
 async def technology_detail(
     request: Request,
     tech_name: str,
     conn=Depends(db),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """
     Returns all entities that used this technology, plus the technology
@@ -1536,9 +1619,7 @@ async def technology_detail(
     detail = query_technology_detail(conn, tech_name)
     if not detail["entities"] and not detail["tech_entity"]:
         return err(f"Technology '{tech_name}' not found", 404)
-    detail["entities"] = _localise_many(conn, detail["entities"], resolved)
-    for key in detail["by_flavor"]:
-        detail["by_flavor"][key] = _localise_many(conn, detail["by_flavor"][key], resolved)
+    _localise_detail(conn, detail, resolved)
     
     # Add metrics
     metrics = get_tag_metrics(conn, tech_name, "technology")
@@ -1550,29 +1631,17 @@ async def technology_detail(
 
 # ── Stages ────────────────────────────────────────────────────────────────────
 
-@app.get("/stages", summary="Career + education timeline")
+@app.get("/stages", summary="Career + education timeline", dependencies=[Depends(http_cache)])
 @limiter.limit("120/minute")
 async def stages_list(
     request: Request,
     conn=Depends(db),
-    category: Optional[str] = Query(
-        None,
-        description="Filter by category: education | job",
-    ),
-    tag: Optional[str] = Query(
-        None,
-        description="Filter by generic tag",
-    ),
-    skill: Optional[str] = Query(
-        None,
-        description="Filter by skill tag",
-    ),
-    technology: Optional[str] = Query(
-        None,
-        description="Filter by technology tag",
-    ),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    category: StageCategoryQuery   = None,
+    tag: TagFilterQuery            = None,
+    skill: SkillFilterQuery        = None,
+    technology: TechFilterQuery    = None,
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """
     Returns the complete career and education timeline — every job, role,
@@ -1590,11 +1659,7 @@ async def stages_list(
     """
     resolved = resolve_lang(lang, accept_language)
     stages = query_stages(conn, category=category, tag=tag, skill=skill, technology=technology)
-    stages = _localise_many(conn, stages, resolved)
-    return ok(
-        {"stages": stages, "count": len(stages)},
-        meta=_lang_meta(resolved),
-    )
+    return _stream_ok(request, conn, "stages", stages, resolved)
 
 
 @app.get("/stages/{entity_id}", summary="Single career/education stage")
@@ -1603,8 +1668,8 @@ async def stage_detail(
     request: Request,
     entity_id: str,
     conn=Depends(db),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """
     Full detail for one career or education stage:
@@ -1613,8 +1678,10 @@ async def stage_detail(
       - Related entities (company, institution, connected projects)
     """
     resolved = resolve_lang(lang, accept_language)
+    if get_entity_flavor(conn, entity_id) != "stages":
+        raise HTTPException(404, "Stage not found")
     detail = get_entity(conn, entity_id)
-    if not detail or detail.get("flavor") != "stages":
+    if not detail:
         raise HTTPException(404, "Stage not found")
     
     # Apply translation
@@ -1625,29 +1692,17 @@ async def stage_detail(
 
 # ── Oeuvre ───────────────────────────────────────────────────────────────────
 
-@app.get("/oeuvre", summary="Side projects + literature")
+@app.get("/oeuvre", summary="Side projects + literature", dependencies=[Depends(http_cache)])
 @limiter.limit("120/minute")
 async def oeuvre_list(
     request: Request,
     conn=Depends(db),
-    category: Optional[str] = Query(
-        None,
-        description="Filter by category: coding | blog_post | article | book | website",
-    ),
-    tag: Optional[str] = Query(
-        None,
-        description="Filter by generic tag",
-    ),
-    skill: Optional[str] = Query(
-        None,
-        description="Filter by skill tag",
-    ),
-    technology: Optional[str] = Query(
-        None,
-        description="Filter by technology tag",
-    ),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    category: OeuvreCategoryQuery  = None,
+    tag: TagFilterQuery            = None,
+    skill: SkillFilterQuery        = None,
+    technology: TechFilterQuery    = None,
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """
     Returns all oeuvre: GitHub projects, blog posts, Medium articles,
@@ -1664,11 +1719,7 @@ async def oeuvre_list(
     """
     resolved = resolve_lang(lang, accept_language)
     items = query_oeuvre(conn, category=category, tag=tag, skill=skill, technology=technology)
-    items = _localise_many(conn, items, resolved)
-    return ok(
-        {"oeuvre": items, "count": len(items)},
-        meta=_lang_meta(resolved),
-    )
+    return _stream_ok(request, conn, "oeuvre", items, resolved)
 
 
 @app.get("/oeuvre/{entity_id}", summary="Single oeuvre item detail")
@@ -1677,8 +1728,8 @@ async def oeuvre_detail(
     request: Request,
     entity_id: str,
     conn=Depends(db),
-    lang: Optional[str]            = Query(None, description="en | de"),
-    accept_language: Optional[str] = Header(None, alias="Accept-Language"),
+    lang: LangQuery                = None,
+    accept_language: AcceptLang    = None,
 ):
     """
     Full detail for one oeuvre item (project or article):
@@ -1689,8 +1740,10 @@ async def oeuvre_detail(
       - Source URL and any related URLs
     """
     resolved = resolve_lang(lang, accept_language)
+    if get_entity_flavor(conn, entity_id) != "oeuvre":
+        raise HTTPException(404, "Oeuvre item not found")
     detail = get_entity(conn, entity_id)
-    if not detail or detail.get("flavor") != "oeuvre":
+    if not detail:
         raise HTTPException(404, "Oeuvre item not found")
     
     # Apply translation
@@ -8,7 +8,9 @@ Purpose:
 
 Main functions:
   - get_tool_definitions(): Returns JSON Schema for all available tools
+  - get_tool_definitions_json(): Same catalogue, pre-encoded as JSON bytes
   - execute_tool(): Maps tool name + args to database queries
+  - execute_tool_batch(): Runs several tool calls on one connection/snapshot
   - normalize_search_term(): Fuzzy matching for close variations
 
 Tool catalog:
@@ -22,15 +24,22 @@ Dependencies:
   - db/models.py: Database query functions
 """
 
+import copy
+import json
 import sqlite3
+import threading
+import time
+from types import MappingProxyType
 from typing import Any, Optional
 from db.models import (
     query_stages,
     query_oeuvre,
-    query_technology_detail,
-    get_tag_metrics,
+    query_flavor_by_term,
+    query_technology_bundle,
     query_skills_with_metrics,
     list_entities,
+    search_entities,
+    epoch_cache_key,
 )
 
 
@@ -140,6 +149,13 @@ TOOL_REGISTRY = [
     }
 ]
 
+# The catalogue is static: serialize it once and freeze it so handlers can
+# serve the bytes directly and nothing can mutate the shared definitions.
+_TOOL_DEFS_JSON: bytes = json.dumps(
+    TOOL_REGISTRY, ensure_ascii=False, separators=(",", ":")
+).encode("utf-8")
+TOOL_REGISTRY = tuple(MappingProxyType(d) for d in TOOL_REGISTRY)
+
 
 # --- FUZZY MATCHING ---
 
@@ -162,12 +178,147 @@ TECH_ALIASES = {
     "k8s": "Kubernetes",
     "kubernetes": "Kubernetes",
 }
+# Read-only, keys pre-lowered; merged into the tag cache's lookup index below
+TECH_ALIASES = MappingProxyType({k.lower(): v for k, v in TECH_ALIASES.items()})
+
+
+# Kept as module constants so every call hands sqlite3 the identical SQL text
+# and hits the connection's prepared-statement cache instead of re-parsing.
+_EXACT_TAG_SQL = """
+    SELECT tag FROM tags
+    WHERE LOWER(tag) = LOWER(?)
+    GROUP BY tag
+    ORDER BY COUNT(*) DESC
+    LIMIT 1
+"""
+
+# Prefix match as a range scan on idx_tags_lower (LOWER(tag) expression index)
+_PREFIX_TAG_SQL = """
+    SELECT tag FROM tags
+    WHERE LOWER(tag) >= ? AND LOWER(tag) < ?
+    GROUP BY tag
+    ORDER BY COUNT(*) DESC
+    LIMIT 1
+"""
+
+# Substring match via the trigram index (see db.models.FTS_SCHEMA); the
+# trigram tokenizer needs at least 3 characters to produce a match.
+_FTS_TAG_SQL = """
+    SELECT tag FROM tags
+    WHERE id IN (SELECT rowid FROM tags_fts WHERE tags_fts MATCH ?)
+    GROUP BY tag
+    ORDER BY COUNT(*) DESC
+    LIMIT 1
+"""
+
+_PARTIAL_TAG_SQL = """
+    SELECT tag FROM tags
+    WHERE LOWER(tag) LIKE LOWER(?)
+    GROUP BY tag
+    ORDER BY COUNT(*) DESC
+    LIMIT 1
+"""
+
+
+_ALL_TAGS_SQL = "SELECT tag FROM tags GROUP BY tag ORDER BY COUNT(*) DESC"
+
+# In-process tag lookup state, rebuilt whenever the content epoch changes:
+#   by_lower  lower(term) → alias target or most frequently used tag spelling
+#   resolved  term → result of an earlier prefix/substring lookup
+_tag_cache: dict = {"key": (), "by_lower": {}, "resolved": {}}
+_RESOLVED_MAX = 1024
+
+
+def _current_tag_cache(conn: sqlite3.Connection) -> Optional[dict]:
+    """Return the tag cache for the current epoch, or None if uncacheable."""
+    global _tag_cache
+    key = epoch_cache_key(conn)
+    if not key:
+        return None
+    if _tag_cache["key"] != key:
+        by_lower: dict[str, str] = {}
+        for (tag,) in conn.execute(_ALL_TAGS_SQL):
+            by_lower.setdefault(tag.lower(), tag)
+        by_lower.update(TECH_ALIASES)  # aliases win over tag spellings
+        _tag_cache = {"key": key, "by_lower": by_lower, "resolved": {}}
+    return _tag_cache
+
+
+def _match_partial(term: str, conn: sqlite3.Connection) -> str:
+    """Prefix match, then substring match; returns *term* if nothing matches."""
+    # Try prefix match (indexed range scan)
+    prefix = term.lower()
+    row = conn.execute(_PREFIX_TAG_SQL, (prefix, prefix + "\U0010ffff")).fetchone()
+    if row:
+        return row["tag"]
+    
+    # Try partial match — trigram index first, LIKE %term% as fallback
+    row, use_like = None, len(term) < 3
+    if not use_like:
+        phrase = '"' + term.replace('"', '""') + '"'
+        try:
+            row = conn.execute(_FTS_TAG_SQL, (phrase,)).fetchone()
+        except sqlite3.OperationalError:
+            use_like = True  # tags_fts missing (SQLite built without FTS5)
+    if use_like:
+        row = conn.execute(_PARTIAL_TAG_SQL, (f"%{term}%",)).fetchone()
+    
+    if row:
+        return row["tag"]
+    
+    # No match found, return original
+    return term
+
+
+def _subsequence_score(pattern: str, candidate: str) -> int:
+    """
+    Score *pattern* as an in-order subsequence of *candidate* (both lower
+    case): one point per matched character, plus two for a match directly
+    after the previous one and two for a match at a word start. Returns -1
+    if some pattern character cannot be matched.
+    """
+    score, pos, prev = 0, 0, -2
+    for ch in pattern:
+        pos = candidate.find(ch, pos)
+        if pos < 0:
+            return -1
+        score += 1
+        if pos == prev + 1:
+            score += 2
+        if pos == 0 or not candidate[pos - 1].isalnum():
+            score += 2
+        prev = pos
+        pos += 1
+    return score
+
+
+def _match_subsequence(lowered: str, by_lower: dict) -> Optional[str]:
+    """
+    Last-resort fuzzy match for abbreviations such as "pstgrs" or "dckr":
+    the best-scoring known term that contains *lowered* as a subsequence.
+    Only considered for terms of 3+ characters that cover at least half of
+    the candidate, so short or unrelated inputs are returned unchanged.
+    """
+    if len(lowered) < 3:
+        return None
+    best, best_key = 0, None
+    for key in by_lower:
+        if len(key) > 2 * len(lowered):
+            continue
+        score = _subsequence_score(lowered, key)
+        if score > best or (score == best and best_key and len(key) < len(best_key)):
+            best, best_key = score, key
+    return by_lower[best_key] if best_key else None
 
 
 def normalize_search_term(term: str, conn: sqlite3.Connection) -> str:
     """
     Normalize search term to match existing tags in database.
-    First checks aliases, then tries case-insensitive LIKE query.
+    First checks aliases, then an exact case-insensitive match, then a
+    prefix match, then a substring match (FTS5 trigram index, LIKE fallback),
+    then a subsequence match against the known tags (abbreviations).
+    Exact matches and earlier results are served from an in-process cache
+    that is dropped whenever the content epoch changes.
     
     Args:
         term: User-provided search term
@@ -176,49 +327,69 @@ def normalize_search_term(term: str, conn: sqlite3.Connection) -> str:
     Returns:
         Normalized term or original if no match found
     """
-    # Try alias lookup first
-    normalized = TECH_ALIASES.get(term.lower())
-    if normalized:
-        return normalized
-    
-    # Try case-insensitive exact match in tags table
-    row = conn.execute("""
-        SELECT tag FROM tags
-        WHERE LOWER(tag) = LOWER(?)
-        GROUP BY tag
-        ORDER BY COUNT(*) DESC
-        LIMIT 1
-    """, (term,)).fetchone()
-    
-    if row:
-        return row["tag"]
-    
-    # Try partial match (LIKE %term%)
-    row = conn.execute("""
-        SELECT tag FROM tags
-        WHERE LOWER(tag) LIKE LOWER(?)
-        GROUP BY tag
-        ORDER BY COUNT(*) DESC
-        LIMIT 1
-    """, (f"%{term}%",)).fetchone()
-    
-    if row:
-        return row["tag"]
+    lowered = term.lower()
+    cache = _current_tag_cache(conn)
+    if cache is None:
+        # No epoch table to validate a cache against — query directly
+        normalized = TECH_ALIASES.get(lowered)
+        if normalized:
+            return normalized
+        row = conn.execute(_EXACT_TAG_SQL, (term,)).fetchone()
+        return row["tag"] if row else _match_partial(term, conn)
     
-    # No match found, return original
-    return term
+    # Alias or case-insensitive exact match, then earlier fuzzy results
+    exact = cache["by_lower"].get(lowered)
+    if exact:
+        return exact
+    # Shared across threadpool requests and cleared when full: return the
+    # local value rather than re-reading the dict
+    resolved = cache["resolved"]
+    match = resolved.get(term)
+    if match is None:
+        if len(resolved) >= _RESOLVED_MAX:
+            resolved.clear()
+        match = _match_partial(term, conn)
+        if match == term:
+            match = _match_subsequence(lowered, cache["by_lower"]) or term
+        resolved[term] = match
+    return match
 
 
 # --- TOOL EXECUTION ---
 
-def execute_tool(conn: sqlite3.Connection, tool_name: str, arguments: dict) -> dict:
+def _normalize(term: str, conn: sqlite3.Connection, term_cache: Optional[dict]) -> str:
+    """normalize_search_term(), memoised in *term_cache* when one is given."""
+    if term_cache is None:
+        return normalize_search_term(term, conn)
+    if term not in term_cache:
+        term_cache[term] = normalize_search_term(term, conn)
+    return term_cache[term]
+
+
+# All tools are read-only, so results are a pure function of
+# (database content, tool, arguments). Cache them briefly, keyed to the
+# content epoch so any write invalidates immediately.
+_RESULT_TTL = 60.0
+_RESULT_CACHE_MAX = 256
+_result_cache: dict[tuple, tuple[float, dict]] = {}
+_result_lock = threading.Lock()  # tool routes run in the threadpool
+
+
+def execute_tool(conn: sqlite3.Connection, tool_name: str, arguments: dict,
+                 term_cache: Optional[dict] = None) -> dict:
     """
     Execute a tool by name with provided arguments.
     
+    Results are served from a short-lived in-process cache when the same
+    call was made recently against the same content epoch. Each caller gets
+    its own copy, so mutating the result cannot affect other callers.
+    
     Args:
         conn: Database connection
         tool_name: Name of tool to execute
         arguments: Tool-specific arguments
+        term_cache: Optional dict shared across calls to reuse search-term
+            normalisation (see execute_tool_batch)
     
     Returns:
         Result dictionary with data and metadata
@@ -226,218 +397,269 @@ def execute_tool(conn: sqlite3.Connection, tool_name: str, arguments: dict) -> d
     Raises:
         ValueError: If tool_name is unknown or arguments are invalid
     """
-    
-    # --- QUERY STAGES ---
-    if tool_name == "query_stages":
-        category: Optional[str] = arguments.get("category")
-        search_term: Optional[str] = arguments.get("search_term")
-        
-        # Validate category if provided
-        if category and category not in ["education", "job"]:
-            raise ValueError(f"Invalid category '{category}'. Must be 'education' or 'job'.")
-        
-        # Execute base query
-        if search_term:
-            # Normalize technology/skill search term
-            normalized_term = normalize_search_term(search_term, conn)
-            # Try as technology first
-            results = query_stages(conn, category=category or None, technology=normalized_term)
-            # If no results, try as skill
-            if not results:
-                results = query_stages(conn, category=category or None, skill=normalized_term)
-            # If still no results, try as generic tag
-            if not results:
-                results = query_stages(conn, category=category or None, tag=search_term)
-        else:
-            results = query_stages(conn, category=category or None)
-        
-        return {
-            "status": "success",
-            "data": {
-                "stages": results,
-                "count": len(results),
-                "filters": {
-                    "category": category,
-                    "search_term": search_term
-                }
+    epoch_key = epoch_cache_key(conn)
+    if not epoch_key:
+        return _execute_tool(conn, tool_name, arguments, term_cache)
+
+    key = (epoch_key, tool_name, json.dumps(arguments, sort_keys=True, default=str))
+    now = time.monotonic()
+    with _result_lock:
+        hit = _result_cache.get(key)
+    if hit and now - hit[0] < _RESULT_TTL:
+        return copy.deepcopy(hit[1])
+
+    result = _execute_tool(conn, tool_name, arguments, term_cache)
+    cached = copy.deepcopy(result)
+    with _result_lock:
+        if len(_result_cache) >= _RESULT_CACHE_MAX:
+            _result_cache.pop(next(iter(_result_cache)), None)  # evict oldest entry
+        _result_cache[key] = (now, cached)
+    return result
+
+
+# --- QUERY STAGES ---
+
+def _tool_query_stages(conn: sqlite3.Connection, arguments: dict,
+                       term_cache: Optional[dict]) -> dict:
+    category: Optional[str] = arguments.get("category")
+    search_term: Optional[str] = arguments.get("search_term")
+
+    # Validate category if provided
+    if category and category not in ["education", "job"]:
+        raise ValueError(f"Invalid category '{category}'. Must be 'education' or 'job'.")
+
+    # Execute base query
+    if search_term:
+        # Normalize technology/skill search term
+        normalized_term = _normalize(search_term, conn, term_cache)
+        # Technology match first, then skill, then generic tag — one query
+        results = query_flavor_by_term(
+            conn, "stages", normalized_term,
+            generic_term=search_term, category=category or None,
+        )
+    else:
+        results = query_stages(conn, category=category or None)
+
+    return {
+        "status": "success",
+        "data": {
+            "stages": results,
+            "count": len(results),
+            "filters": {
+                "category": category,
+                "search_term": search_term
             }
         }
-    
-    # --- QUERY PORTFOLIO ---
-    elif tool_name == "query_portfolio":
-        flavor: Optional[str] = arguments.get("flavor")
-        tag: Optional[str] = arguments.get("tag")
-        
-        # Validate flavor if provided
-        valid_flavors = ["coding", "blog_post", "article", "book", "website"]
-        if flavor and flavor not in valid_flavors:
-            raise ValueError(f"Invalid flavor '{flavor}'. Must be one of: {', '.join(valid_flavors)}.")
-        
-        # Execute base query
-        if tag:
-            # Normalize tag
-            normalized_tag = normalize_search_term(tag, conn)
-            # Try as technology first
-            results = query_oeuvre(conn, category=flavor or None, technology=normalized_tag)
-            # If no results, try as skill
-            if not results:
-                results = query_oeuvre(conn, category=flavor or None, skill=normalized_tag)
-            # If still no results, try as generic tag
-            if not results:
-                results = query_oeuvre(conn, category=flavor or None, tag=tag)
-        else:
-            results = query_oeuvre(conn, category=flavor or None)
-        
-        return {
-            "status": "success",
-            "data": {
-                "portfolio": results,
-                "count": len(results),
-                "filters": {
-                    "flavor": flavor,
-                    "tag": tag
-                }
+    }
+
+
+# --- QUERY PORTFOLIO ---
+
+def _tool_query_portfolio(conn: sqlite3.Connection, arguments: dict,
+                          term_cache: Optional[dict]) -> dict:
+    flavor: Optional[str] = arguments.get("flavor")
+    tag: Optional[str] = arguments.get("tag")
+
+    # Validate flavor if provided
+    valid_flavors = ["coding", "blog_post", "article", "book", "website"]
+    if flavor and flavor not in valid_flavors:
+        raise ValueError(f"Invalid flavor '{flavor}'. Must be one of: {', '.join(valid_flavors)}.")
+
+    # Execute base query
+    if tag:
+        # Normalize tag
+        normalized_tag = _normalize(tag, conn, term_cache)
+        # Technology match first, then skill, then generic tag — one query
+        results = query_flavor_by_term(
+            conn, "oeuvre", normalized_tag,
+            generic_term=tag, category=flavor or None,
+        )
+    else:
+        results = query_oeuvre(conn, category=flavor or None)
+
+    return {
+        "status": "success",
+        "data": {
+            "portfolio": results,
+            "count": len(results),
+            "filters": {
+                "flavor": flavor,
+                "tag": tag
             }
         }
-    
-    # --- GET TECHNOLOGY METRICS ---
-    elif tool_name == "get_technology_metrics":
-        tech_name = arguments.get("tech_name")
-        
-        if not tech_name:
-            raise ValueError("tech_name is required")
-        
-        # Normalize technology name
-        normalized_name = normalize_search_term(tech_name, conn)
-        
-        # Get technology detail (includes all entities using it)
-        tech_detail = query_technology_detail(conn, normalized_name)
-        
-        # Get metrics if available
-        metrics = get_tag_metrics(conn, normalized_name, "technology")
-        
-        return {
-            "status": "success",
-            "data": {
-                "technology": normalized_name,
-                "original_query": tech_name if tech_name != normalized_name else None,
-                "metrics": metrics,
-                "entity_count": tech_detail.get("entity_count", 0),
-                "by_flavor": tech_detail.get("by_flavor", {})
-            }
+    }
+
+
+# --- GET TECHNOLOGY METRICS ---
+
+def _tool_get_technology_metrics(conn: sqlite3.Connection, arguments: dict,
+                                 term_cache: Optional[dict]) -> dict:
+    tech_name = arguments.get("tech_name")
+
+    if not tech_name:
+        raise ValueError("tech_name is required")
+
+    # Normalize technology name
+    normalized_name = _normalize(tech_name, conn, term_cache)
+
+    # Metrics (if calculated) and all entities using it, grouped by flavor
+    bundle = query_technology_bundle(conn, normalized_name)
+
+    return {
+        "status": "success",
+        "data": {
+            "technology": normalized_name,
+            "original_query": tech_name if tech_name != normalized_name else None,
+            "metrics": bundle["metrics"],
+            "entity_count": bundle["entity_count"],
+            "by_flavor": bundle["by_flavor"]
         }
-    
-    # --- QUERY SKILLS ---
-    elif tool_name == "query_skills":
-        min_proficiency = arguments.get("min_proficiency")
-        limit = arguments.get("limit", 50)
-        
-        # Validate min_proficiency if provided
-        if min_proficiency is not None:
-            if not isinstance(min_proficiency, (int, float)) or min_proficiency < 0 or min_proficiency > 100:
-                raise ValueError("min_proficiency must be a number between 0 and 100")
-        
-        # Validate limit
-        if not isinstance(limit, int) or limit < 1 or limit > 200:
-            raise ValueError("limit must be an integer between 1 and 200")
-        
-        # Query skills with metrics
-        all_skills = query_skills_with_metrics(
-            conn,
-            order_by="relevance_score",
-            limit=limit
-        )
-        
-        # Filter by min_proficiency if provided
-        if min_proficiency is not None:
-            skills = [
-                s for s in all_skills 
-                if s.get("proficiency") and float(s["proficiency"]) >= min_proficiency
-            ]
-        else:
-            skills = all_skills
-        
-        return {
-            "status": "success",
-            "data": {
-                "skills": skills,
-                "count": len(skills),
-                "filters": {
-                    "min_proficiency": min_proficiency,
-                    "limit": limit
-                }
+    }
+
+
+# --- QUERY SKILLS ---
+
+def _tool_query_skills(conn: sqlite3.Connection, arguments: dict,
+                       term_cache: Optional[dict]) -> dict:
+    min_proficiency = arguments.get("min_proficiency")
+    limit = arguments.get("limit", 50)
+
+    # Validate min_proficiency if provided
+    if min_proficiency is not None:
+        if not isinstance(min_proficiency, (int, float)) or min_proficiency < 0 or min_proficiency > 100:
+            raise ValueError("min_proficiency must be a number between 0 and 100")
+
+    # Validate limit
+    if not isinstance(limit, int) or limit < 1 or limit > 200:
+        raise ValueError("limit must be an integer between 1 and 200")
+
+    # Query skills with metrics (proficiency filter applied before LIMIT)
+    skills = query_skills_with_metrics(
+        conn,
+        order_by="relevance_score",
+        limit=limit,
+        min_proficiency=min_proficiency
+    )
+
+    return {
+        "status": "success",
+        "data": {
+            "skills": skills,
+            "count": len(skills),
+            "filters": {
+                "min_proficiency": min_proficiency,
+                "limit": limit
             }
         }
-    
-    # --- SEARCH ENTITIES ---
-    elif tool_name == "search_entities":
-        query = arguments.get("query")
-        flavor = arguments.get("flavor")
-        limit = arguments.get("limit", 20)
-        
-        # Validate required fields
-        if not query:
-            raise ValueError("query is required")
-        
-        # Validate flavor if provided
-        if flavor and flavor not in ["stages", "oeuvre", "personal", "identity"]:
-            raise ValueError(f"Invalid flavor '{flavor}'. Must be one of: stages, oeuvre, personal, identity.")
-        
-        # Validate limit
-        if not isinstance(limit, int) or limit < 1 or limit > 100:
-            raise ValueError("limit must be an integer between 1 and 100")
-        
-        # Execute search query
-        # Use SQL LIKE for basic full-text search
-        search_pattern = f"%{query}%"
-        sql = """
-            SELECT DISTINCT e.* FROM entities e
-            LEFT JOIN tags t ON t.entity_id = e.id
-            WHERE e.visibility = 'public'
-            AND (
-                e.title LIKE ? 
-                OR e.description LIKE ?
-                OR t.tag LIKE ?
-            )
-        """
-        params = [search_pattern, search_pattern, search_pattern]
-        
-        if flavor:
-            sql += " AND e.flavor = ?"
-            params.append(flavor)
-        
-        sql += f" ORDER BY e.updated_at DESC LIMIT {limit}"
-        
-        rows = conn.execute(sql, params).fetchall()
-        
-        # Hydrate results using _hydrate helper (import needed)
-        from db.models import _hydrate
-        results = [_hydrate(conn, dict(r)) for r in rows]
-        
-        return {
-            "status": "success",
-            "data": {
-                "results": results,
-                "count": len(results),
-                "query": query,
-                "filters": {
-                    "flavor": flavor,
-                    "limit": limit
-                }
+    }
+
+
+# --- SEARCH ENTITIES ---
+
+def _tool_search_entities(conn: sqlite3.Connection, arguments: dict,
+                          term_cache: Optional[dict]) -> dict:
+    query = arguments.get("query")
+    flavor = arguments.get("flavor")
+    limit = arguments.get("limit", 20)
+
+    # Validate required fields
+    if not query:
+        raise ValueError("query is required")
+
+    # Validate flavor if provided
+    if flavor and flavor not in ["stages", "oeuvre", "personal", "identity"]:
+        raise ValueError(f"Invalid flavor '{flavor}'. Must be one of: stages, oeuvre, personal, identity.")
+
+    # Validate limit
+    if not isinstance(limit, int) or limit < 1 or limit > 100:
+        raise ValueError("limit must be an integer between 1 and 100")
+
+    # Full-text search (FTS5 trigram index, bm25-ranked)
+    results = search_entities(conn, query, flavor=flavor, limit=limit)
+
+    return {
+        "status": "success",
+        "data": {
+            "results": results,
+            "count": len(results),
+            "query": query,
+            "filters": {
+                "flavor": flavor,
+                "limit": limit
             }
         }
-    
-    # --- UNKNOWN TOOL ---
-    else:
+    }
+
+
+_TOOL_HANDLERS = {
+    "query_stages": _tool_query_stages,
+    "query_portfolio": _tool_query_portfolio,
+    "get_technology_metrics": _tool_get_technology_metrics,
+    "query_skills": _tool_query_skills,
+    "search_entities": _tool_search_entities,
+}
+
+
+def _execute_tool(conn: sqlite3.Connection, tool_name: str, arguments: dict,
+                  term_cache: Optional[dict]) -> dict:
+    """Uncached tool dispatch — see execute_tool()."""
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if handler is None:
         raise ValueError(f"Unknown tool: {tool_name}")
+    return handler(conn, arguments, term_cache)
 
 
-def get_tool_definitions() -> list[dict]:
+BATCH_MAX_CALLS = 20
+
+
+def execute_tool_batch(conn: sqlite3.Connection, calls: list[dict]) -> list[dict]:
+    """
+    Execute several tool calls on one connection, preserving input order.
+
+    Search-term normalisation is shared across the batch and all queries run
+    inside one read transaction, so every result reflects the same snapshot.
+    Invalid arguments are reported per call instead of failing the batch.
+
+    Args:
+        conn: Database connection
+        calls: List of {"tool": name, "arguments": {...}} dicts
+
+    Returns:
+        List of {"tool": name, "result": {...}} in the same order as *calls*
+    """
+    term_cache: dict[str, str] = {}
+    results = []
+    conn.execute("BEGIN")
+    try:
+        for call in calls:
+            tool_name = call.get("tool")
+            arguments = call.get("arguments") or {}
+            try:
+                if not isinstance(arguments, dict):
+                    raise ValueError("'arguments' must be an object")
+                result = execute_tool(conn, tool_name, arguments, term_cache)
+            except ValueError as e:
+                result = {"status": "error", "error": {"code": 400, "message": str(e)}}
+            results.append({"tool": tool_name, "result": result})
+    finally:
+        conn.rollback()  # read-only — just release the snapshot
+    return results
+
+
+def get_tool_definitions() -> tuple:
     """
-    Return the list of available tool definitions.
+    Return the available tool definitions.
     Each tool includes name, description, and JSON Schema for arguments.
     
     Returns:
-        List of tool definition dictionaries
+        Tuple of read-only tool definition mappings
     """
     return TOOL_REGISTRY
+
+
+def get_tool_definitions_json() -> bytes:
+    """
+    Return the tool definitions as pre-encoded compact JSON (UTF-8 bytes).
+    Computed once at import; use it to answer tools/list without re-encoding.
+    """
+    return _TOOL_DEFS_JSON
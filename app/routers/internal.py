@@ -32,6 +32,8 @@ router = APIRouter(tags=["Internal"])
 import os as _os
 _PROXY_SECRET = _os.getenv("PROXY_SECRET", "")
 
+_sha256 = hashlib.sha256
+
 
 # ── Models ──────────────────────────────────────────────────────────────────
 
@@ -83,7 +85,7 @@ def _verify_proxy_secret(x_proxy_secret: str = Header("")) -> None:
     response_model=DeriveResponse,
     summary="Create a scoped derived token (proxy-only)",
 )
-async def derive_token(
+def derive_token(
     req: DeriveRequest,
     x_proxy_secret: str = Header(""),
     conn=Depends(_get_db_conn),
@@ -95,6 +97,10 @@ async def derive_token(
     is used for MCP API calls instead of the original chat token.
 
     Requires X-Proxy-Secret header (same secret the bot adapters use).
+
+    Plain ``def``: FastAPI runs it in the threadpool, so the INSERT/commit
+    never blocks the event loop. get_db() already opens connections in WAL
+    with synchronous=NORMAL, so the commit itself does not fsync.
     """
     _verify_proxy_secret(x_proxy_secret)
 
@@ -112,11 +118,10 @@ async def derive_token(
 
     # Generate derived token
     raw_token = secrets.token_urlsafe(32)
-    hashed = hashlib.sha256(raw_token.encode()).hexdigest()
-    expires_at = (
-        datetime.now(timezone.utc) + timedelta(minutes=req.ttl_minutes)
-    ).isoformat()
-    created_at = datetime.now(timezone.utc).isoformat()
+    hashed = _sha256(raw_token.encode()).hexdigest()
+    now = datetime.now(timezone.utc)
+    created_at = now.isoformat()
+    expires_at = (now + timedelta(minutes=req.ttl_minutes)).isoformat()
 
     conn.execute(
         """
@@ -145,7 +150,7 @@ class RevokeRequest(BaseModel):
     "/internal/tokens/revoke",
     summary="Revoke a derived token (proxy-only)",
 )
-async def revoke_derived_token(
+def revoke_derived_token(
     req: RevokeRequest,
     x_proxy_secret: str = Header(""),
     conn=Depends(_get_db_conn),
@@ -153,7 +158,7 @@ async def revoke_derived_token(
     """Revoke a derived token by its raw value."""
     _verify_proxy_secret(x_proxy_secret)
 
-    hashed = hashlib.sha256(req.derived_token.encode()).hexdigest()
+    hashed = _sha256(req.derived_token.encode()).hexdigest()
     result = conn.execute(
         "UPDATE derived_tokens SET is_active = 0 WHERE token_value = ?",
         (hashed,),
@@ -9,6 +9,7 @@ Purpose:
 Endpoints:
   GET  /mcp/tools                              → List available tool definitions with schemas
   POST /mcp/tools/call                         → Execute a tool with arguments
+  POST /mcp/tools/batch                        → Execute several tools in one round-trip
   GET  /mcp/resources                          → List available MCP resources
   GET  /mcp/resources/read                     → Read a specific resource by URI
 
@@ -29,18 +30,30 @@ Security:
 
 Dependencies:
   - app.mcp_tools: Tool registry and execution logic
+  - app.i18n: Language negotiation and translation overlay
   - db.models: Database query functions via dependency injection
 """
 
+import threading
+import time
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Request, Depends, Query, Header
-import json
+from fastapi.responses import Response
+import orjson
 
-from app.mcp_tools import get_tool_definitions, execute_tool
+from app.mcp_tools import (
+    get_tool_definitions, get_tool_definitions_json, execute_tool,
+    execute_tool_batch, BATCH_MAX_CALLS,
+)
 from app.dependencies.access_control import (
-    require_private_access, TokenInfo, log_usage,
+    require_private_access, TokenInfo, log_usage_deferred,
+)
+from app.i18n import resolve_lang, _localise_many
+from db.models import (
+    acquire_db, release_db, DB_PATH, query_stages, query_oeuvre,
+    query_skills_with_metrics, query_technologies_with_metrics,
+    list_all_tags, epoch_cache_key, SUPPORTED_LANGS, DEFAULT_LANG,
 )
-from db.models import get_db, DB_PATH
 
 
 # --- ROUTER SETUP ---
@@ -48,6 +61,19 @@ from db.models import get_db, DB_PATH
 router = APIRouter(prefix="/mcp", tags=["MCP Tools"])
 
 
+# The tool catalogue is static: resolve it once for every request
+_TOOL_DEFS = get_tool_definitions()
+_TOOL_NAMES = frozenset(t["name"] for t in _TOOL_DEFS)
+_AVAILABLE_TOOLS = ", ".join(t["name"] for t in _TOOL_DEFS)
+
+# Envelope for GET /mcp/tools, built once from the pre-encoded catalogue
+_TOOLS_LIST_BODY = (
+    b'{"status":"success","data":{"tools":%s,"count":%d,'
+    b'"execution_endpoint":"/mcp/tools/call"}}'
+    % (get_tool_definitions_json(), len(_TOOL_DEFS))
+)
+
+
 # --- HELPER FUNCTIONS ---
 
 def ok(data: dict, meta: Optional[dict] = None) -> dict:
@@ -60,11 +86,11 @@ def ok(data: dict, meta: Optional[dict] = None) -> dict:
 
 def db():
     """Database connection dependency."""
-    conn = get_db(DB_PATH)
+    conn = acquire_db(DB_PATH)
     try:
         yield conn
     finally:
-        conn.close()
+        release_db(conn, DB_PATH)
 
 
 def get_resource_definitions() -> list:
@@ -137,7 +163,219 @@ def get_resource_definitions() -> list:
     ]
 
 
+_RESOURCE_DEFS = tuple(get_resource_definitions())
+_RESOURCE_BY_URI = {r["uri"]: r for r in _RESOURCE_DEFS}
+_AVAILABLE_URIS = ", ".join(_RESOURCE_BY_URI)
+
+# GET /mcp/resources body — definitions without the internal route field
+_PUBLIC_RESOURCES = [
+    {
+        "uri": r["uri"],
+        "name": r["name"],
+        "description": r["description"],
+        "mimeType": r["mimeType"]
+    }
+    for r in _RESOURCE_DEFS
+]
+# Envelope for GET /mcp/resources, encoded once like _TOOLS_LIST_BODY
+_RESOURCES_LIST_BODY = orjson.dumps(ok({
+    "resources": _PUBLIC_RESOURCES,
+    "count": len(_PUBLIC_RESOURCES)
+}))
+
+
+# --- RESOURCE READERS ---
+# One function per resource URI: (conn, resolved_lang) → resource data.
+
+# Only the three identity sections the greeting renders; ordered like
+# list_entities so the same row wins when a category appears twice
+_SQL_GREETING_SECTIONS = """
+    SELECT id, category, title, raw_data FROM entities
+    WHERE flavor='identity' AND visibility='public'
+      AND category IN ('basic', 'links', 'contact')
+    ORDER BY start_date DESC NULLS LAST, date DESC NULLS LAST, updated_at DESC
+"""
+_SQL_GENERIC_TAGS = (
+    "SELECT tag FROM tags WHERE entity_id=? AND tag_type='generic' ORDER BY tag"
+)
+
+
+def _read_greeting(conn, lang: str) -> dict:
+    sections: dict[str, tuple] = {}
+    for entity_id, category, title, raw_data in conn.execute(_SQL_GREETING_SECTIONS):
+        try:
+            raw = orjson.loads(raw_data) if raw_data else {}
+        except orjson.JSONDecodeError:
+            raw = {}
+        sections[category] = (entity_id, title, raw.get(lang, raw.get(DEFAULT_LANG, {})))
+    if not sections:
+        raise HTTPException(404, "Identity entities not found")
+
+    basic_id, basic_title, basic_lang = sections.get("basic", (None, "", {}))
+    links_lang = sections.get("links", (None, "", {}))[2]
+    contact_lang = sections.get("contact", (None, "", {}))[2]
+    tags = [row[0] for row in conn.execute(_SQL_GENERIC_TAGS, (basic_id,))] if basic_id else []
+
+    return {
+        "name":        basic_lang.get("name", basic_title),
+        "tagline":     basic_lang.get("tagline", ""),
+        "description": basic_lang.get("description", ""),
+        "location":    basic_lang.get("location", ""),
+        "links":       links_lang,
+        "contact": {
+            "reason":    contact_lang.get("reason", ""),
+            "preferred": contact_lang.get("preferred", ""),
+            "email":     contact_lang.get("email", ""),
+            "phone":     contact_lang.get("phone", ""),
+            "telegram":  contact_lang.get("telegram", ""),
+            "other":     contact_lang.get("other", ""),
+        },
+        "tags": tags,
+    }
+
+
+def _read_stages(conn, lang: str) -> dict:
+    stages = query_stages(conn, category=None, tag=None, skill=None, technology=None)
+    stages = _localise_many(conn, stages, lang)
+    return {"stages": stages, "count": len(stages)}
+
+
+def _read_technology_stack(conn, lang: str) -> dict:
+    technologies = query_technologies_with_metrics(conn)
+    return {"technologies": technologies, "count": len(technologies)}
+
+
+def _read_skills(conn, lang: str) -> dict:
+    skills = query_skills_with_metrics(conn)
+    return {"skills": skills, "count": len(skills)}
+
+
+def _read_oeuvre(conn, lang: str) -> dict:
+    oeuvre = query_oeuvre(conn, category=None, tag=None, skill=None, technology=None)
+    oeuvre = _localise_many(conn, oeuvre, lang)
+    return {"oeuvre": oeuvre, "count": len(oeuvre)}
+
+
+# Fixed statement texts, so pooled connections reuse their prepared statements
+_SQL_CATEGORIES = """
+    SELECT flavor, category, COUNT(*) as count FROM entities
+    WHERE visibility='public'
+    GROUP BY flavor, category ORDER BY flavor, count DESC
+"""
+_SQL_TOTAL_PUBLIC = "SELECT COUNT(*) FROM entities WHERE visibility='public'"
+_SQL_LANG_COUNTS = (
+    "SELECT lang, COUNT(DISTINCT entity_id) FROM entity_translations GROUP BY lang"
+)
+_SQL_GREETING_LANGS = "SELECT lang FROM greeting_translations"
+
+
+def _read_categories(conn, lang: str) -> dict:
+    rows = conn.execute(_SQL_CATEGORIES).fetchall()
+    flavors_data = {"flavors": {}, "total": 0}
+    for row in rows:
+        flavor = row["flavor"]
+        category = row["category"] or "uncategorized"
+        count = row["count"]
+        if flavor not in flavors_data["flavors"]:
+            flavors_data["flavors"][flavor] = {"total": 0, "categories": {}}
+        flavors_data["flavors"][flavor]["categories"][category] = count
+        flavors_data["flavors"][flavor]["total"] += count
+        flavors_data["total"] += count
+    return flavors_data
+
+
+def _read_tags(conn, lang: str) -> dict:
+    tags = list_all_tags(conn)
+    return {"tags": tags, "count": len(tags)}
+
+
+def _read_languages(conn, lang: str) -> dict:
+    # Get translation coverage (matching languages endpoint logic)
+    # Note: Original query uses 'type' but entities table has 'flavor' column
+    total = conn.execute(_SQL_TOTAL_PUBLIC).fetchone()[0]
+    
+    translated = dict(conn.execute(_SQL_LANG_COUNTS).fetchall())
+    greeting_langs = {row[0] for row in conn.execute(_SQL_GREETING_LANGS)}
+    
+    coverage = []
+    for lang_code in sorted(SUPPORTED_LANGS):
+        n_translated = translated.get(lang_code, 0)
+        coverage.append({
+            "lang": lang_code,
+            "is_default": lang_code == DEFAULT_LANG,
+            "entities_total": total,
+            "entities_translated": n_translated,
+            "coverage_pct": round(n_translated / total * 100, 1) if total else 0,
+            "greeting_translated": lang_code in greeting_langs,
+        })
+    
+    return {"languages": coverage}
+
+
+_RESOURCE_HANDLERS = {
+    "me://profile/greeting": _read_greeting,
+    "me://profile/stages": _read_stages,
+    "me://profile/technology_stack": _read_technology_stack,
+    "me://profile/skills": _read_skills,
+    "me://profile/oeuvre": _read_oeuvre,
+    "me://profile/categories": _read_categories,
+    "me://profile/tags": _read_tags,
+    "me://profile/languages": _read_languages,
+}
+
+
+# Serialised resource text by (content epoch, uri, lang). Readers are pure
+# functions of DB content, so any write (epoch bump) invalidates at once;
+# the TTL only bounds how long an unused entry lingers.
+_RESOURCE_TTL = 60.0
+_RESOURCE_CACHE_MAX = 128
+_resource_cache: dict[tuple, tuple[float, str]] = {}
+
+
+# Single-flight: concurrent misses on one key wait for the first reader
+# instead of each running the same queries in its own threadpool thread.
+_inflight: dict[tuple, threading.Lock] = {}
+_inflight_guard = threading.Lock()
+
+
+def _read_resource_text(conn, uri: str, lang: str, pretty: bool = False) -> str:
+    """Run the reader for *uri* and return its JSON text, cached per epoch."""
+    epoch_key = epoch_cache_key(conn)
+    if not epoch_key:
+        return _render_resource(conn, uri, lang, pretty)
+
+    key = (epoch_key, uri, lang, pretty)
+    hit = _resource_cache.get(key)
+    if hit and time.monotonic() - hit[0] < _RESOURCE_TTL:
+        return hit[1]
+
+    with _inflight_guard:
+        flight = _inflight.setdefault(key, threading.Lock())
+    with flight:
+        hit = _resource_cache.get(key)
+        if hit and time.monotonic() - hit[0] < _RESOURCE_TTL:
+            return hit[1]
+        try:
+            data_json = _render_resource(conn, uri, lang, pretty)
+            if len(_resource_cache) >= _RESOURCE_CACHE_MAX:
+                _resource_cache.pop(next(iter(_resource_cache)), None)  # evict oldest entry
+            _resource_cache[key] = (time.monotonic(), data_json)
+        finally:
+            with _inflight_guard:
+                _inflight.pop(key, None)
+    return data_json
+
+
+def _render_resource(conn, uri: str, lang: str, pretty: bool) -> str:
+    return orjson.dumps(
+        _RESOURCE_HANDLERS[uri](conn, lang),
+        option=orjson.OPT_INDENT_2 if pretty else 0,
+    ).decode("utf-8")
+
+
 # --- ENDPOINTS ---
+# Handlers that touch SQLite are plain ``def`` so FastAPI runs them in its
+# threadpool; only the static listings stay ``async``.
 
 @router.get("/tools", summary="List available MCP tools")
 async def list_mcp_tools(request: Request):
@@ -172,16 +410,11 @@ async def list_mcp_tools(request: Request):
         }
     }
     """
-    tools = get_tool_definitions()
-    return ok({
-        "tools": tools,
-        "count": len(tools),
-        "execution_endpoint": "/mcp/tools/call"
-    })
+    return Response(content=_TOOLS_LIST_BODY, media_type="application/json")
 
 
 @router.post("/tools/call", summary="Execute an MCP tool")
-async def call_mcp_tool(
+def call_mcp_tool(
     tool_request: dict,
     conn=Depends(db),
     token_info: TokenInfo = Depends(require_private_access),
@@ -235,14 +468,13 @@ async def call_mcp_tool(
     arguments = tool_request.get("arguments", {})
 
     # Log full body args now that they're parsed (supplements the endpoint-level log)
-    log_usage(conn, token_info.id, "/mcp/tools/call", tool_request)
+    log_usage_deferred(token_info.id, "/mcp/tools/call", tool_request)
     
     # Validate tool exists
-    tool_names = [t["name"] for t in get_tool_definitions()]
-    if tool_name not in tool_names:
+    if tool_name not in _TOOL_NAMES:
         raise HTTPException(
             404, 
-            f"Unknown tool '{tool_name}'. Available tools: {', '.join(tool_names)}"
+            f"Unknown tool '{tool_name}'. Available tools: {_AVAILABLE_TOOLS}"
         )
     
     # Execute tool
@@ -255,6 +487,57 @@ async def call_mcp_tool(
         raise HTTPException(500, f"Tool execution failed: {str(e)}")
 
 
+@router.post("/tools/batch", summary="Execute several MCP tools in one request")
+def call_mcp_tools_batch(
+    calls: list[dict],
+    conn=Depends(db),
+    token_info: TokenInfo = Depends(require_private_access),
+):
+    """
+    Execute multiple tool calls in a single round-trip.
+    
+    Request body (max 20 calls):
+    [
+        {"tool": "query_stages", "arguments": {"search_term": "Python"}},
+        {"tool": "get_technology_metrics", "arguments": {"tech_name": "Python"}}
+    ]
+    
+    Returns results in input order:
+    {
+        "status": "success",
+        "data": {
+            "results": [
+                {"tool": "query_stages", "result": { ... same as /mcp/tools/call ... }},
+                {"tool": "get_technology_metrics", "result": {"status": "error", "error": {...}}}
+            ],
+            "count": 2
+        }
+    }
+    
+    All calls share one database connection and snapshot, and repeated
+    search terms are normalised only once. A call with invalid arguments or
+    an unknown tool gets an error result; the other calls still run.
+    
+    Error responses:
+      - 400: Empty batch, too many calls, or a call without 'tool'
+      - 500: Tool execution failure
+    """
+    if not calls:
+        raise HTTPException(400, "Request body must be a non-empty list of tool calls")
+    if len(calls) > BATCH_MAX_CALLS:
+        raise HTTPException(400, f"Too many calls in batch (max {BATCH_MAX_CALLS})")
+    if any("tool" not in call for call in calls):
+        raise HTTPException(400, "Missing 'tool' field in one or more calls")
+
+    log_usage_deferred(token_info.id, "/mcp/tools/batch", {"calls": calls})
+
+    try:
+        results = execute_tool_batch(conn, calls)
+    except Exception as e:
+        raise HTTPException(500, f"Tool execution failed: {str(e)}")
+    return ok({"results": results, "count": len(results)})
+
+
 # --- MCP RESOURCE ENDPOINTS ---
 
 @router.get("/resources", summary="List available MCP resources")
@@ -294,30 +577,15 @@ async def list_mcp_resources(request: Request):
         }
     }
     """
-    resources = get_resource_definitions()
-    
-    # Remove internal route field from public response
-    public_resources = [
-        {
-            "uri": r["uri"],
-            "name": r["name"],
-            "description": r["description"],
-            "mimeType": r["mimeType"]
-        }
-        for r in resources
-    ]
-    
-    return ok({
-        "resources": public_resources,
-        "count": len(public_resources)
-    })
+    return Response(content=_RESOURCES_LIST_BODY, media_type="application/json")
 
 
 @router.get("/resources/read", summary="Read a specific MCP resource")
-async def read_mcp_resource(
+def read_mcp_resource(
     request: Request,
     uri: str = Query(..., description="Resource URI (e.g., me://profile/greeting)"),
     lang: Optional[str] = Query(None, description="Language preference (en|de)"),
+    pretty: bool = Query(False, description="Indent the resource JSON text"),
     accept_language: Optional[str] = Header(None, alias="Accept-Language"),
     conn=Depends(db),
     token_info: TokenInfo = Depends(require_private_access),
@@ -332,6 +600,7 @@ async def read_mcp_resource(
     Query Parameters:
       - uri: Resource URI (e.g., me://profile/greeting)
       - lang: Language preference (optional, defaults based on Accept-Language header)
+      - pretty: Indent the JSON in "text" (optional, compact by default)
     
     Response format (MCP content envelope):
     {
@@ -359,167 +628,34 @@ async def read_mcp_resource(
     
     Error responses:
       - 404: Unknown resource URI
-      - 500: Resource resolution failure
+      - 404: Resource has no data (e.g. no identity entities)
+      - 503: Database busy or locked (see Retry-After)
     """
     # Find matching resource definition
-    resources = get_resource_definitions()
-    resource = next((r for r in resources if r["uri"] == uri), None)
+    resource = _RESOURCE_BY_URI.get(uri)
 
     if not resource:
-        available_uris = [r["uri"] for r in resources]
         raise HTTPException(
             404,
-            f"Unknown resource URI '{uri}'. Available: {', '.join(available_uris)}"
+            f"Unknown resource URI '{uri}'. Available: {_AVAILABLE_URIS}"
         )
 
-    # Import main app to access route handlers and query functions
-    try:
-        from db.models import (
-            get_greeting_translation, query_stages, query_oeuvre,
-            query_skills_with_metrics, query_technologies_with_metrics,
-            list_all_tags, SUPPORTED_LANGS, DEFAULT_LANG
-        )
-        from app.main import resolve_lang, _localise_many, ok as app_ok
-        
-        # Resolve language preference
-        resolved_lang = resolve_lang(lang, accept_language)
-        
-        # Execute query based on URI
-        if uri == "me://profile/greeting":
-            # Fetch identity entities
-            from db.models import list_entities
-            identity_rows = list_entities(conn, flavor="identity", limit=10)
-            if not identity_rows:
-                raise HTTPException(404, "Identity entities not found")
-            
-            # Organize by category
-            identity_data = {}
-            for row in identity_rows:
-                category = row.get("category")
-                if category:
-                    identity_data[category] = row
-            
-            # Get basic info
-            basic_entity = identity_data.get("basic", {})
-            basic_raw = basic_entity.get("raw_data", {})
-            basic_lang = basic_raw.get(resolved_lang, basic_raw.get(DEFAULT_LANG, {}))
-            
-            # Get links info
-            links_entity = identity_data.get("links", {})
-            links_raw = links_entity.get("raw_data", {})
-            links_lang = links_raw.get(resolved_lang, links_raw.get(DEFAULT_LANG, {}))
-            
-            # Get contact info
-            contact_entity = identity_data.get("contact", {})
-            contact_raw = contact_entity.get("raw_data", {})
-            contact_lang = contact_raw.get(resolved_lang, contact_raw.get(DEFAULT_LANG, {}))
-            
-            result_data = {
-                "name":        basic_lang.get("name", basic_entity.get("title", "")),
-                "tagline":     basic_lang.get("tagline", ""),
-                "description": basic_lang.get("description", ""),
-                "location":    basic_lang.get("location", ""),
-                "links":       links_lang,
-                "contact": {
-                    "reason":    contact_lang.get("reason", ""),
-                    "preferred": contact_lang.get("preferred", ""),
-                    "email":     contact_lang.get("email", ""),
-                    "phone":     contact_lang.get("phone", ""),
-                    "telegram":  contact_lang.get("telegram", ""),
-                    "other":     contact_lang.get("other", ""),
-                },
-                "tags": basic_entity.get("tags", []),
-            }
-        
-        elif uri == "me://profile/stages":
-            stages = query_stages(conn, category=None, tag=None, skill=None, technology=None)
-            stages = _localise_many(conn, stages, resolved_lang)
-            result_data = {"stages": stages, "count": len(stages)}
-        
-        elif uri == "me://profile/technology_stack":
-            technologies = query_technologies_with_metrics(conn)
-            result_data = {"technologies": technologies, "count": len(technologies)}
-        
-        elif uri == "me://profile/skills":
-            skills = query_skills_with_metrics(conn)
-            result_data = {"skills": skills, "count": len(skills)}
-        
-        elif uri == "me://profile/oeuvre":
-            oeuvre = query_oeuvre(conn, category=None, tag=None, skill=None, technology=None)
-            oeuvre = _localise_many(conn, oeuvre, resolved_lang)
-            result_data = {"oeuvre": oeuvre, "count": len(oeuvre)}
-        
-        elif uri == "me://profile/categories":
-            rows = conn.execute("""
-                SELECT flavor, category, COUNT(*) as count FROM entities
-                WHERE visibility='public'
-                GROUP BY flavor, category ORDER BY flavor, count DESC
-            """).fetchall()
-            flavors_data = {"flavors": {}, "total": 0}
-            for row in rows:
-                flavor = row["flavor"]
-                category = row["category"] or "uncategorized"
-                count = row["count"]
-                if flavor not in flavors_data["flavors"]:
-                    flavors_data["flavors"][flavor] = {"total": 0, "categories": {}}
-                flavors_data["flavors"][flavor]["categories"][category] = count
-                flavors_data["flavors"][flavor]["total"] += count
-                flavors_data["total"] += count
-            result_data = flavors_data
-        
-        elif uri == "me://profile/tags":
-            tags = list_all_tags(conn)
-            result_data = {"tags": tags, "count": len(tags)}
-        
-        elif uri == "me://profile/languages":
-            # Get translation coverage (matching languages endpoint logic)
-            # Note: Original query uses 'type' but entities table has 'flavor' column
-            total = conn.execute(
-                "SELECT COUNT(*) FROM entities WHERE visibility='public'"
-            ).fetchone()[0]
-            
-            coverage = []
-            for lang_code in sorted(SUPPORTED_LANGS):
-                n_translated = conn.execute(
-                    "SELECT COUNT(DISTINCT entity_id) FROM entity_translations WHERE lang=?",
-                    (lang_code,),
-                ).fetchone()[0]
-                greeting_done = bool(
-                    conn.execute(
-                        "SELECT 1 FROM greeting_translations WHERE lang=?", (lang_code,)
-                    ).fetchone()
-                )
-                coverage.append({
-                    "lang": lang_code,
-                    "is_default": lang_code == DEFAULT_LANG,
-                    "entities_total": total,
-                    "entities_translated": n_translated,
-                    "coverage_pct": round(n_translated / total * 100, 1) if total else 0,
-                    "greeting_translated": greeting_done,
-                })
-            
-            result_data = {"languages": coverage}
-        
-        else:
-            raise HTTPException(404, f"Unknown resource URI '{uri}'")
-        
-        # Wrap result in MCP content envelope
-        data_json = json.dumps(result_data, ensure_ascii=False, indent=2)
-        
-        return ok(
-            {
-                "contents": [
-                    {
-                        "uri": uri,
-                        "mimeType": resource["mimeType"],
-                        "text": data_json,
-                    }
-                ]
-            },
-            meta={"access_stage": token_info.stage},
-        )
-        
-    except ImportError as e:
-        raise HTTPException(500, f"Failed to import dependencies: {str(e)}")
-    except Exception as e:
-        raise HTTPException(500, f"Resource resolution failed: {str(e)}")
+    # Resolve language preference
+    resolved_lang = resolve_lang(lang, accept_language)
+
+    # Execute query based on URI (served from cache when unchanged)
+    data_json = _read_resource_text(conn, uri, resolved_lang, pretty)
+
+    # Wrap result in MCP content envelope
+    return ok(
+        {
+            "contents": [
+                {
+                    "uri": uri,
+                    "mimeType": resource["mimeType"],
+                    "text": data_json,
+                }
+            ]
+        },
+        meta={"access_stage": token_info.stage},
+    )
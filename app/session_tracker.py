@@ -33,14 +33,19 @@ Coverage Calculation:
   - Percentage = (earned_points / total_points) * 100
 """
 
+import atexit
 import hashlib
 import logging
+import logging.handlers
+import queue
 import sqlite3
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from threading import Lock
-from typing import Dict, List, Optional, Tuple, Set
-from urllib.parse import parse_qs, urlparse
+from threading import Lock, Thread
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+from urllib.parse import unquote_plus
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -59,17 +64,22 @@ CREATE TABLE IF NOT EXISTS sessions (
 
 CREATE INDEX IF NOT EXISTS idx_sessions_last_seen ON sessions(last_seen);
 
+-- One row per (visitor, endpoint); bit n of pages_mask = page n visited
 CREATE TABLE IF NOT EXISTS session_coverage (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     visitor_id TEXT NOT NULL,
     endpoint_pattern TEXT NOT NULL,
-    page_number INTEGER DEFAULT 0,
+    pages_mask INTEGER NOT NULL DEFAULT 0,
+    last_page INTEGER DEFAULT 0,
     timestamp TIMESTAMP NOT NULL,
     FOREIGN KEY (visitor_id) REFERENCES sessions(visitor_id) ON DELETE CASCADE,
-    UNIQUE (visitor_id, endpoint_pattern, page_number)
+    UNIQUE (visitor_id, endpoint_pattern)
 );
 
-CREATE INDEX IF NOT EXISTS idx_coverage_visitor ON session_coverage(visitor_id);
+-- UNIQUE (visitor_id, endpoint_pattern) is the lookup index for both the
+-- coverage upsert and the per-visitor read; a visitor_id-only index would
+-- just be a redundant prefix of it
+DROP INDEX IF EXISTS idx_coverage_visitor;
 
 CREATE TABLE IF NOT EXISTS request_log (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -85,6 +95,61 @@ CREATE INDEX IF NOT EXISTS idx_log_timestamp ON request_log(timestamp);
 """
 
 
+# Highest page with its own bit in pages_mask (SQLite integers are 64-bit
+# signed); deeper pages share the last bit
+MAX_MASK_PAGE = 62
+
+# request_log rows are buffered and written by a background thread, up to
+# LOG_BATCH_MAX per transaction; past LOG_QUEUE_MAX the oldest are dropped
+LOG_QUEUE_MAX = 10000
+LOG_BATCH_MAX = 500
+
+# Tracked requests between explicit WAL truncations
+WAL_CHECKPOINT_EVERY = 1000
+
+# Paginated endpoints: (coverage_pct, earned) by distinct pages visited;
+# three or more pages earn the full point
+_PAGE_CREDIT = {1: (50.0, 0.5), 2: (75.0, 0.75)}
+_FULL_CREDIT = (100.0, 1.0)
+
+# Seconds between sweeps of all expired sessions from track_request
+CLEANUP_INTERVAL_SECONDS = 60.0
+
+# Statement texts, shared by every call so the connection's statement cache
+# hands back the compiled statement instead of re-preparing it
+_SQL_EXPIRE_ALL = (
+    "DELETE FROM sessions WHERE last_seen < ? RETURNING visitor_id, request_count"
+)
+_SQL_EXPIRE_ONE = (
+    "DELETE FROM sessions WHERE visitor_id = ? AND last_seen < ? "
+    "RETURNING visitor_id, request_count"
+)
+_SQL_DELETE_SESSION = "DELETE FROM sessions WHERE visitor_id = ?"
+_SQL_GET_SESSION = "SELECT * FROM sessions WHERE visitor_id = ?"
+_SQL_UPSERT_SESSION = (
+    "INSERT INTO sessions (visitor_id, anonymized_ip, user_agent, first_seen, last_seen, request_count) "
+    "VALUES (?, ?, ?, ?, ?, 1) "
+    "ON CONFLICT(visitor_id) DO UPDATE SET "
+    "last_seen = excluded.last_seen, request_count = request_count + 1 "
+    "RETURNING request_count, first_seen"
+)
+_SQL_UPSERT_COVERAGE = (
+    "INSERT INTO session_coverage (visitor_id, endpoint_pattern, pages_mask, last_page, timestamp) "
+    "VALUES (?, ?, ?, ?, ?) "
+    "ON CONFLICT(visitor_id, endpoint_pattern) DO UPDATE SET "
+    "pages_mask = pages_mask | excluded.pages_mask, last_page = excluded.last_page"
+)
+# Written after the fact: skip rows whose session expired in the meantime
+_SQL_INSERT_LOG = (
+    "INSERT INTO request_log (visitor_id, endpoint, method, timestamp) "
+    "SELECT ?, ?, ?, ? WHERE EXISTS (SELECT 1 FROM sessions WHERE visitor_id = ?)"
+)
+_SQL_VISITED_ENDPOINTS = (
+    "SELECT endpoint_pattern, pages_mask FROM session_coverage WHERE visitor_id = ?"
+)
+_SQL_COUNT_SESSIONS = "SELECT COUNT(*) as count FROM sessions"
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # SESSION TRACKER
 # ─────────────────────────────────────────────────────────────────────────────
@@ -102,7 +167,8 @@ class SessionTracker:
         timeout_hours: float = 5.0,
         log_file: Optional[str] = None,
         db_path: str = "db/sessions.db",
-        relevant_endpoints: Optional[Dict[str, dict]] = None
+        relevant_endpoints: Optional[Dict[str, dict]] = None,
+        ignored_endpoints: Optional[Iterable[str]] = None
     ):
         """
         Initialize session tracker with SQLite backend.
@@ -112,18 +178,38 @@ class SessionTracker:
             log_file: Path to log file for session activity
             db_path: Path to SQLite database
             relevant_endpoints: Dict of {endpoint_pattern: {weight, paginated}}
+            ignored_endpoints: Exact paths (health checks, docs, ...) that are
+                               not tracked at all
         """
         self.timeout_hours = timeout_hours
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.lock = Lock()
+        self._writes = 0
+        self._last_cleanup = float("-inf")
+        # {visitor_id: (cached_at, visited_map, coverage)}; reused while the
+        # visitor's page masks are unchanged (repeat visits to known pages).
+        # Only read or written while holding self.lock
+        self._coverage_cache: Dict[str, Tuple[float, Dict[str, int], dict]] = {}
         
-        # Relevant endpoints configuration
+        # Relevant endpoints configuration, plus the lookups derived from it
         self.relevant_endpoints = relevant_endpoints or {}
+        self._exact_endpoints = frozenset(self.relevant_endpoints)
+        self._prefix_map = tuple(
+            (prefix, pattern) for prefix, pattern in _PREFIX_PATTERNS
+            if pattern in self._exact_endpoints
+        )
+        self._ignored_endpoints = frozenset(ignored_endpoints or ())
         
         # Initialize database
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
         self._init_db()
         
+        # Diagnostic request_log writes happen off the request path
+        self._log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_MAX)
+        self._log_thread = Thread(target=self._log_writer, name="session-log", daemon=True)
+        self._log_thread.start()
+        
         # Setup logging
         self.logger = logging.getLogger("session_tracker")
         self.logger.setLevel(logging.INFO)
@@ -136,42 +222,122 @@ class SessionTracker:
                 '%(asctime)s | %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             ))
-            self.logger.addHandler(handler)
+            # Log calls (made under self.lock) only enqueue; a listener
+            # thread does the file writes, in order
+            log_queue: queue.Queue = queue.Queue(-1)
+            self._log_listener = logging.handlers.QueueListener(log_queue, handler)
+            self._log_listener.start()
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     def _init_db(self):
-        """Initialize SQLite database with schema."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.executescript(SCHEMA_SQL)
-        conn.commit()
-        conn.close()
+        """
+        Open the tracker's long-lived SQLite connection and apply the schema.
+        Every method uses this one connection under ``self.lock``, so a
+        tracked request costs no file open/close or PRAGMA round-trip.
+        """
+        # isolation_level=None: transactions are explicit (BEGIN IMMEDIATE ...
+        # COMMIT) so each tracked request is exactly one write transaction
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None,
+            cached_statements=256,
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")  # Enable CASCADE deletes
+        # WAL: readers don't block the writer, and one fsync per checkpoint
+        # instead of two per commit
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA busy_timeout = 30000")
+        self._conn.execute("PRAGMA temp_store = MEMORY")
+        self._conn.execute("PRAGMA cache_size = -20000")  # ~20 MB
+        # Pre-bitmap layout kept one row per page; coverage is per-session
+        # data, so the old table is simply rebuilt
+        legacy = self._conn.execute(
+            "SELECT 1 FROM pragma_table_info('session_coverage') WHERE name = 'page_number'"
+        ).fetchone()
+        if legacy:
+            self._conn.execute("DROP TABLE session_coverage")
+        self._conn.executescript(SCHEMA_SQL)
+        atexit.register(self.close)
     
     def _get_conn(self) -> sqlite3.Connection:
-        """Get SQLite connection with row factory."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")  # Enable CASCADE deletes
-        return conn
+        """Return the shared SQLite connection (callers hold ``self.lock``)."""
+        return self._conn
     
-    def _cleanup_expired(self, conn: sqlite3.Connection):
-        """Remove expired sessions."""
-        cutoff = datetime.now() - timedelta(hours=self.timeout_hours)
-        expired = conn.execute(
-            "SELECT visitor_id, request_count FROM sessions WHERE last_seen < ?",
-            (cutoff,)
-        ).fetchall()
+    def close(self):
+        """
+        Flush queued request_log rows and log lines, then close the shared
+        connection (registered with atexit).
+        """
+        if self._log_thread.is_alive():
+            self._enqueue_log(None)  # shutdown sentinel
+            self._log_thread.join(timeout=5)
+        with self.lock:
+            self._conn.close()
+        if self._log_listener is not None:
+            self._log_listener.stop()  # flushes pending log lines
+            self._log_listener = None
+    
+    def _enqueue_log(self, row: Optional[tuple]):
+        """Queue a request_log row, dropping the oldest one when the buffer is full."""
+        while True:
+            try:
+                self._log_queue.put_nowait(row)
+                return
+            except queue.Full:
+                try:
+                    self._log_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _log_writer(self):
+        """Drain the request_log queue, one transaction per batch."""
+        running = True
+        while running:
+            batch = [self._log_queue.get()]
+            while len(batch) < LOG_BATCH_MAX:
+                try:
+                    batch.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:  # shutdown sentinel: write what is queued, then stop
+                running = False
+                batch = [row for row in batch if row is not None]
+                if not batch:
+                    break
+            with self.lock:
+                try:
+                    self._conn.execute("BEGIN IMMEDIATE")
+                    self._conn.executemany(_SQL_INSERT_LOG, batch)
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error as e:
+                    if self._conn.in_transaction:
+                        self._conn.execute("ROLLBACK")
+                    self.logger.warning(f"REQUEST_LOG_FAILED | rows={len(batch)} | {e}")
+    
+    def _cleanup_expired(self, conn: sqlite3.Connection, visitor_id: Optional[str] = None):
+        """
+        Remove expired sessions (inside the caller's transaction) in a single
+        DELETE ... RETURNING; deletes cascade to coverage and logs. With
+        *visitor_id*, only that visitor's session is checked.
+        """
+        # Same text form sqlite3's default datetime adapter wrote
+        cutoff = (datetime.now() - timedelta(hours=self.timeout_hours)).isoformat(" ")
+        if visitor_id is None:
+            expired = conn.execute(_SQL_EXPIRE_ALL, (cutoff,)).fetchall()
+            self._last_cleanup = time.monotonic()
+            # Also drop cache entries for sessions another worker expired
+            stale = self._last_cleanup - self.timeout_hours * 3600
+            for vid in [v for v, entry in self._coverage_cache.items() if entry[0] < stale]:
+                self._coverage_cache.pop(vid, None)
+        else:
+            expired = conn.execute(_SQL_EXPIRE_ONE, (visitor_id, cutoff)).fetchall()
         
         for row in expired:
-            visitor_id = row['visitor_id']
-            request_count = row['request_count']
-            
-            # Delete session (cascades to coverage and logs)
-            conn.execute("DELETE FROM sessions WHERE visitor_id = ?", (visitor_id,))
-            
+            self._coverage_cache.pop(row['visitor_id'], None)
             self.logger.info(
-                f"SESSION_EXPIRED | {visitor_id} | requests={request_count}"
+                f"SESSION_EXPIRED | {row['visitor_id']} | requests={row['request_count']}"
             )
-        
-        conn.commit()
     
     def track_request(
         self,
@@ -179,7 +345,8 @@ class SessionTracker:
         user_agent: str,
         endpoint: str,
         method: str = "GET",
-        query_params: Optional[Dict] = None
+        query_params: Optional[Dict] = None,
+        raw_query: Optional[str] = None
     ) -> dict:
         """
         Track a request and return coverage metadata.
@@ -190,115 +357,133 @@ class SessionTracker:
             endpoint: Request endpoint path
             method: HTTP method
             query_params: Parsed query parameters (for pagination detection)
+            raw_query: Raw query string; scanned directly instead of
+                       query_params when given (no full parse needed)
         
         Returns:
             Coverage metadata dictionary
         """
         anonymized_ip = _anonymize_ip(ip_address)
         visitor_id = _generate_visitor_id(anonymized_ip, user_agent)
+        
+        # Ignored paths never touch the database (no session, no headers)
+        if endpoint in self._ignored_endpoints:
+            return {"visitor_id": visitor_id}
+        
+        normalized = _normalize_endpoint(endpoint, self._exact_endpoints, self._prefix_map)
         now = datetime.now()
+        # Formatted once and bound as text to every statement of the request
+        now_db = now.isoformat(" ")
         
         with self.lock:
             conn = self._get_conn()
             try:
-                self._cleanup_expired(conn)
+                conn.execute("BEGIN IMMEDIATE")
+                # Sweep everything at most once per interval; in between only
+                # this visitor's own stale session is dropped, so it still
+                # starts fresh after the timeout
+                if time.monotonic() - self._last_cleanup >= CLEANUP_INTERVAL_SECONDS:
+                    self._cleanup_expired(conn)
+                else:
+                    self._cleanup_expired(conn, visitor_id)
                 
-                # Get or create session
-                session = conn.execute(
-                    "SELECT * FROM sessions WHERE visitor_id = ?",
-                    (visitor_id,)
+                # Create or bump the session in one statement
+                request_count, first_seen = conn.execute(
+                    _SQL_UPSERT_SESSION,
+                    (visitor_id, anonymized_ip, user_agent, now_db, now_db)
                 ).fetchone()
-                
-                if not session:
-                    conn.execute(
-                        "INSERT INTO sessions (visitor_id, anonymized_ip, user_agent, first_seen, last_seen, request_count) "
-                        "VALUES (?, ?, ?, ?, ?, ?)",
-                        (visitor_id, anonymized_ip, user_agent, now, now, 0)
-                    )
+                is_new = request_count == 1
+                if is_new:
                     self.logger.info(
                         f"SESSION_NEW | {visitor_id} | ip={anonymized_ip} | ua={user_agent[:80]}"
                     )
                 
-                # Update session
-                conn.execute(
-                    "UPDATE sessions SET last_seen = ?, request_count = request_count + 1 "
-                    "WHERE visitor_id = ?",
-                    (now, visitor_id)
-                )
-                
-                # Get updated request count
-                request_count = conn.execute(
-                    "SELECT request_count FROM sessions WHERE visitor_id = ?",
-                    (visitor_id,)
-                ).fetchone()['request_count']
-                
                 # Track coverage
-                normalized = _normalize_endpoint(endpoint, list(self.relevant_endpoints.keys()))
-                page_number = _extract_page_number(query_params) if query_params else 0
-                
                 if normalized:
+                    page_number = (
+                        _extract_page_number_from_raw(raw_query) if raw_query is not None
+                        else _extract_page_number(query_params) if query_params else 0
+                    )
+                    page_bit = 1 << max(0, min(page_number, MAX_MASK_PAGE))
                     conn.execute(
-                        "INSERT OR IGNORE INTO session_coverage (visitor_id, endpoint_pattern, page_number, timestamp) "
-                        "VALUES (?, ?, ?, ?)",
-                        (visitor_id, normalized, page_number, now)
+                        _SQL_UPSERT_COVERAGE,
+                        (visitor_id, normalized, page_bit, page_number, now_db)
                     )
                 
-                # Log request
-                conn.execute(
-                    "INSERT INTO request_log (visitor_id, endpoint, method, timestamp) "
-                    "VALUES (?, ?, ?, ?)",
-                    (visitor_id, endpoint, method, now)
-                )
-                
                 self.logger.info(
                     f"REQUEST | {visitor_id} | {method} {endpoint} | count={request_count}"
                 )
                 
-                conn.commit()
+                conn.execute("COMMIT")
                 
-                # Calculate coverage
-                coverage = self._calculate_coverage(conn, visitor_id)
+                # Log request (written in the background)
+                self._enqueue_log((visitor_id, endpoint, method, now_db, visitor_id))
                 
-                return {
-                    "visitor_id": visitor_id,
-                    "session": {
-                        "first_seen": session['first_seen'] if session else now.isoformat(),
-                        "last_seen": now.isoformat(),
-                        "request_count": request_count,
-                        "timeout_hours": self.timeout_hours,
-                    },
-                    "coverage": coverage
-                }
+                # Keep the WAL file from growing between automatic checkpoints
+                self._writes += 1
+                if self._writes % WAL_CHECKPOINT_EVERY == 0:
+                    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                
+                # A request outside the relevant endpoints can't change the
+                # coverage: reuse the cached breakdown instead of re-reading
+                cached = self._coverage_cache.get(visitor_id)
+                visited_map = (
+                    cached[1] if cached and not (normalized or is_new)
+                    else self._visited_masks(conn, visitor_id)
+                )
             
-            finally:
-                conn.close()
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")  # don't leave a half-written request behind
+                raise
+        
+        # Coverage is plain Python over the fetched rows; no lock needed
+        return {
+            "visitor_id": visitor_id,
+            "session": {
+                "first_seen": now.isoformat() if is_new else first_seen,
+                "last_seen": now.isoformat(),
+                "request_count": request_count,
+                "timeout_hours": self.timeout_hours,
+            },
+            "coverage": self._cached_coverage(visitor_id, visited_map, cached)
+        }
+    
+    def _visited_masks(self, conn: sqlite3.Connection, visitor_id: str) -> Dict[str, int]:
+        """Return ``{endpoint_pattern: pages_mask}`` for a visitor (callers hold ``self.lock``)."""
+        return dict(conn.execute(_SQL_VISITED_ENDPOINTS, (visitor_id,)).fetchall())
     
-    def _calculate_coverage(self, conn: sqlite3.Connection, visitor_id: str) -> dict:
+    def _cached_coverage(
+        self,
+        visitor_id: str,
+        visited_map: Dict[str, int],
+        cached: Optional[Tuple[float, Dict[str, int], dict]],
+    ) -> dict:
+        """
+        Coverage for *visitor_id*, recomputed only when its page masks differ
+        from *cached* (the cache entry the caller read under ``self.lock``).
+        The masks are always read from SQLite, so pages recorded by other
+        workers still invalidate the entry. Runs without the lock; only the
+        cache store takes it. The returned dict is shared; treat it as read-only.
+        """
+        if cached is not None and cached[1] == visited_map:
+            return cached[2]
+        coverage = self._calculate_coverage(visited_map)
+        with self.lock:
+            self._coverage_cache[visitor_id] = (time.monotonic(), visited_map, coverage)
+        return coverage
+    
+    def _calculate_coverage(self, visited_map: Dict[str, int]) -> dict:
         """
         Calculate coverage percentage with pagination awareness.
         Each endpoint counts equally (1 point). Pagination affects per-endpoint completion.
         
         Args:
-            conn: SQLite connection
-            visitor_id: Session visitor ID
+            visited_map: ``{endpoint_pattern: pages_mask}`` from ``_visited_masks``
         
         Returns:
             Coverage dict with visited, total, percentage, breakdown
         """
-        visited_rows = conn.execute(
-            "SELECT endpoint_pattern, page_number FROM session_coverage WHERE visitor_id = ?",
-            (visitor_id,)
-        ).fetchall()
-        
-        # Group by endpoint pattern
-        visited_map: Dict[str, Set[int]] = {}
-        for row in visited_rows:
-            pattern = row['endpoint_pattern']
-            page = row['page_number']
-            if pattern not in visited_map:
-                visited_map[pattern] = set()
-            visited_map[pattern].add(page)
-        
         # Calculate simple coverage (each endpoint = 1 point)
         total_points = len(self.relevant_endpoints)
         earned_points = 0.0
@@ -306,35 +491,25 @@ class SessionTracker:
         breakdown = []
         for pattern, config in self.relevant_endpoints.items():
             is_paginated = config.get('paginated', False)
-            visited_pages = visited_map.get(pattern, set())
+            pages_mask = visited_map.get(pattern, 0)
+            num_pages = bin(pages_mask).count("1")
             
-            if not visited_pages:
+            if not num_pages:
                 # Not visited
-                coverage_pct = 0.0
-                earned = 0.0
+                coverage_pct, earned = 0.0, 0.0
             elif not is_paginated:
                 # Non-paginated: full point on first visit
-                coverage_pct = 100.0
-                earned = 1.0
+                coverage_pct, earned = _FULL_CREDIT
             else:
                 # Paginated: partial points based on pages visited
-                num_pages = len(visited_pages)
-                if num_pages == 1:
-                    coverage_pct = 50.0
-                    earned = 0.5
-                elif num_pages == 2:
-                    coverage_pct = 75.0
-                    earned = 0.75
-                else:
-                    coverage_pct = 100.0
-                    earned = 1.0
+                coverage_pct, earned = _PAGE_CREDIT.get(num_pages, _FULL_CREDIT)
             
             earned_points += earned
             
             breakdown.append({
                 "endpoint": pattern,
-                "visited": len(visited_pages) > 0,
-                "pages_visited": sorted(list(visited_pages)) if visited_pages else [],
+                "visited": num_pages > 0,
+                "pages_visited": [p for p in range(pages_mask.bit_length()) if pages_mask >> p & 1],
                 "coverage_pct": round(coverage_pct, 1),
                 "earned": round(earned, 2),
                 "paginated": is_paginated,
@@ -368,10 +543,7 @@ class SessionTracker:
         with self.lock:
             conn = self._get_conn()
             try:
-                session = conn.execute(
-                    "SELECT * FROM sessions WHERE visitor_id = ?",
-                    (visitor_id,)
-                ).fetchone()
+                session = conn.execute(_SQL_GET_SESSION, (visitor_id,)).fetchone()
                 
                 if not session:
                     return {
@@ -380,46 +552,51 @@ class SessionTracker:
                         "message": "No active session. Call any endpoint to start tracking.",
                     }
                 
-                coverage = self._calculate_coverage(conn, visitor_id)
-                
-                # Identify missing endpoints
-                missing = []
-                incomplete = []
-                
-                for item in coverage['breakdown']:
-                    if not item['visited']:
-                        missing.append({
-                            "endpoint": item['endpoint'],
-                            "paginated": item['paginated'],
-                        })
-                    elif item['paginated'] and item['coverage_pct'] < 100.0:
-                        incomplete.append({
-                            "endpoint": item['endpoint'],
-                            "pages_visited": item['pages_visited'],
-                            "coverage_pct": item['coverage_pct'],
-                            "suggestion": "Visit more pages (offset/limit params) to increase coverage"
-                        })
-                
-                return {
-                    "visitor_id": visitor_id,
-                    "session_exists": True,
-                    "session": {
-                        "first_seen": session['first_seen'],
-                        "last_seen": session['last_seen'],
-                        "request_count": session['request_count'],
-                    },
-                    "coverage": {
-                        "percentage": coverage['percentage'],
-                        "earned_points": coverage['earned_points'],
-                        "total_points": coverage['total_points'],
-                    },
-                    "missing_endpoints": missing,
-                    "incomplete_endpoints": incomplete,
-                    "breakdown": coverage['breakdown'],
-                }
+                visited_map = self._visited_masks(conn, visitor_id)
+                cached = self._coverage_cache.get(visitor_id)
             
-            finally:
-                conn.close()
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+        
+        coverage = self._cached_coverage(visitor_id, visited_map, cached)
+        
+        # Identify missing endpoints
+        missing = []
+        incomplete = []
+        
+        for item in coverage['breakdown']:
+            if not item['visited']:
+                missing.append({
+                    "endpoint": item['endpoint'],
+                    "paginated": item['paginated'],
+                })
+            elif item['paginated'] and item['coverage_pct'] < 100.0:
+                incomplete.append({
+                    "endpoint": item['endpoint'],
+                    "pages_visited": item['pages_visited'],
+                    "coverage_pct": item['coverage_pct'],
+                    "suggestion": "Visit more pages (offset/limit params) to increase coverage"
+                })
+        
+        return {
+            "visitor_id": visitor_id,
+            "session_exists": True,
+            "session": {
+                "first_seen": session['first_seen'],
+                "last_seen": session['last_seen'],
+                "request_count": session['request_count'],
+            },
+            "coverage": {
+                "percentage": coverage['percentage'],
+                "earned_points": coverage['earned_points'],
+                "total_points": coverage['total_points'],
+            },
+            "missing_endpoints": missing,
+            "incomplete_endpoints": incomplete,
+            "breakdown": coverage['breakdown'],
+        }
     
     def reset_session(self, ip_address: str, user_agent: str):
         """
@@ -435,13 +612,11 @@ class SessionTracker:
         with self.lock:
             conn = self._get_conn()
             try:
-                session = conn.execute(
-                    "SELECT * FROM sessions WHERE visitor_id = ?",
-                    (visitor_id,)
-                ).fetchone()
+                conn.execute("BEGIN IMMEDIATE")
+                session = conn.execute(_SQL_GET_SESSION, (visitor_id,)).fetchone()
                 
                 if session:
-                    coverage = self._calculate_coverage(conn, visitor_id)
+                    coverage = self._calculate_coverage(self._visited_masks(conn, visitor_id))
                     self.logger.info(
                         f"SESSION_RESET | {visitor_id} | "
                         f"requests={session['request_count']} | "
@@ -449,22 +624,25 @@ class SessionTracker:
                     )
                     
                     # Delete session (cascades to coverage and logs)
-                    conn.execute("DELETE FROM sessions WHERE visitor_id = ?", (visitor_id,))
-                    conn.commit()
+                    conn.execute(_SQL_DELETE_SESSION, (visitor_id,))
+                    self._coverage_cache.pop(visitor_id, None)
+                conn.execute("COMMIT")
             
-            finally:
-                conn.close()
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
     
     def get_stats(self) -> dict:
         """Get overall tracker statistics."""
         with self.lock:
             conn = self._get_conn()
             try:
+                conn.execute("BEGIN IMMEDIATE")
                 self._cleanup_expired(conn)
+                conn.execute("COMMIT")
                 
-                active_sessions = conn.execute(
-                    "SELECT COUNT(*) as count FROM sessions"
-                ).fetchone()['count']
+                active_sessions = conn.execute(_SQL_COUNT_SESSIONS).fetchone()['count']
                 
                 return {
                     "active_sessions": active_sessions,
@@ -473,14 +651,19 @@ class SessionTracker:
                     "timeout_hours": self.timeout_hours,
                 }
             
-            finally:
-                conn.close()
+            except Exception:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # HELPER FUNCTIONS
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Both helpers are pure and see the same few (IP, UA) pairs over and over;
+# memoised, a repeat request skips the split/format and the hash.
+@lru_cache(maxsize=4096)
 def _anonymize_ip(ip: str) -> str:
     """
     Remove last octet from IP address.
@@ -501,6 +684,7 @@ def _anonymize_ip(ip: str) -> str:
     return "unknown.x"
 
 
+@lru_cache(maxsize=4096)
 def _generate_visitor_id(anonymized_ip: str, user_agent: str) -> str:
     """
     Generate unique visitor ID from anonymized IP and user agent.
@@ -510,14 +694,27 @@ def _generate_visitor_id(anonymized_ip: str, user_agent: str) -> str:
         user_agent: User-Agent header
     
     Returns:
-        SHA256 hash (first 16 chars)
+        16 hex chars (BLAKE2b with an 8-byte digest; a fingerprint, not a secret)
     """
     combined = f"{anonymized_ip}|{user_agent}"
-    hash_obj = hashlib.sha256(combined.encode('utf-8'))
-    return hash_obj.hexdigest()[:16]
+    return hashlib.blake2b(combined.encode('utf-8'), digest_size=8).hexdigest()
+
+
+# Path prefix → generic pattern for routes with a path parameter
+_PREFIX_PATTERNS = (
+    ("/stages/", "/stages/{id}"),
+    ("/oeuvre/", "/oeuvre/{id}"),
+    ("/skills/", "/skills/{name}"),
+    ("/technology/", "/technology/{name}"),
+    ("/tags/", "/tags/{tag_name}"),
+)
 
 
-def _normalize_endpoint(path: str, relevant_patterns: List[str]) -> Optional[str]:
+def _normalize_endpoint(
+    path: str,
+    exact_patterns: FrozenSet[str],
+    prefix_map: Tuple[Tuple[str, str], ...],
+) -> Optional[str]:
     """
     Normalize endpoint path to match relevant endpoint patterns.
     
@@ -527,34 +724,46 @@ def _normalize_endpoint(path: str, relevant_patterns: List[str]) -> Optional[str
     
     Args:
         path: Request path
-        relevant_patterns: List of relevant endpoint patterns
+        exact_patterns: Relevant endpoint patterns
+        prefix_map: (prefix, pattern) pairs whose pattern is relevant
     
     Returns:
         Normalized pattern or None if not relevant
     """
     # Remove query params
-    if "?" in path:
-        path = path.split("?")[0]
+    path = path.partition("?")[0]
     
     # Exact matches
-    if path in relevant_patterns:
+    if path in exact_patterns:
         return path
     
     # Pattern matches
-    if path.startswith("/stages/") and "/stages/{id}" in relevant_patterns:
-        return "/stages/{id}"
-    elif path.startswith("/oeuvre/") and "/oeuvre/{id}" in relevant_patterns:
-        return "/oeuvre/{id}"
-    elif path.startswith("/skills/") and "/skills/{name}" in relevant_patterns:
-        return "/skills/{name}"
-    elif path.startswith("/technology/") and "/technology/{name}" in relevant_patterns:
-        return "/technology/{name}"
-    elif path.startswith("/tags/") and "/tags/{tag_name}" in relevant_patterns:
-        return "/tags/{tag_name}"
+    for prefix, pattern in prefix_map:
+        if path.startswith(prefix):
+            return pattern
     
     return None
 
 
+_PAGINATION_KEYS = frozenset(("offset", "page", "skip", "limit"))
+
+
+def _extract_page_number_from_raw(raw_query: str) -> int:
+    """
+    Like ``_extract_page_number`` but straight from the raw query string:
+    one split over ``&``, keeping only the pagination keys (last value wins,
+    as with Starlette's ``dict(request.query_params)``).
+    """
+    if not raw_query:
+        return 0
+    params = {}
+    for token in raw_query.split("&"):
+        key, _, value = token.partition("=")
+        if key in _PAGINATION_KEYS:
+            params[key] = unquote_plus(value) if "%" in value or "+" in value else value
+    return _extract_page_number(params) if params else 0
+
+
 def _extract_page_number(query_params: Dict) -> int:
     """
     Extract page number from query parameters.
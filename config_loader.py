@@ -9,10 +9,32 @@ Precedence: config.content.yaml values overwrite config.tech.yaml values
 on key collision (content is user-specific, tech is more generic defaults).
 """
 
-from typing import Optional, Union
+import copy
+from typing import Dict, Optional, Tuple, Union
 import yaml
 from pathlib import Path
 
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Parsed files keyed on path, with the (mtime_ns, size) they were read at
+_parsed: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+
+
+def _load_yaml(path: Path) -> Optional[dict]:
+    """Parse *path*, re-reading only when it changed on disk; None if missing."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _parsed.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path) as f:
+            cached = (stamp, yaml.load(f, Loader=_Loader) or {})
+        _parsed[path] = cached
+    return cached[1]
+
 
 def load_config(root: Optional[Union[Path, str]] = None) -> dict:
     """
@@ -24,6 +46,7 @@ def load_config(root: Optional[Union[Path, str]] = None) -> dict:
 
     Returns:
         Merged configuration dict (tech settings + content/source settings).
+        Files are only re-parsed when they changed on disk.
     """
     if root is None:
         root = Path(__file__).parent
@@ -31,10 +54,9 @@ def load_config(root: Optional[Union[Path, str]] = None) -> dict:
 
     merged: dict = {}
     for name in ("config.tech.yaml", "config.content.yaml"):
-        path = root / name
-        if path.exists():
-            with open(path) as f:
-                data = yaml.safe_load(f) or {}
+        data = _load_yaml(root / name)
+        if data is not None:
             merged.update(data)
 
-    return merged
+    # Callers may modify the result; keep the cached parse untouched
+    return copy.deepcopy(merged)
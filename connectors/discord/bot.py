@@ -20,16 +20,20 @@ intents.dm_messages = True
 client = discord.Client(intents=intents)
 
 
-def call_proxy(chat_id: str, message: str) -> dict:
-    with httpx.Client() as http:
-        r = http.post(
-            f"{PROXY_URL}/chat",
-            json={"chat_id": chat_id, "message": message},
-            headers={"X-Proxy-Secret": SECRET},
-            timeout=30,
-        )
-        r.raise_for_status()
-        return r.json()
+# One pooled client for every message: keep-alive connections to the proxy
+# are reused instead of reconnecting per call
+_http = httpx.AsyncClient(
+    base_url=PROXY_URL,
+    headers={"X-Proxy-Secret": SECRET},
+    timeout=30,
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
+
+
+async def call_proxy(chat_id: str, message: str) -> dict:
+    r = await _http.post("/chat", json={"chat_id": chat_id, "message": message})
+    r.raise_for_status()
+    return r.json()
 
 
 @client.event
@@ -59,7 +63,7 @@ async def on_message(message: discord.Message):
 
     async with message.channel.typing():
         try:
-            data = call_proxy(chat_id, text)
+            data = await call_proxy(chat_id, text)
             reply = data["reply"]
             starters = data.get("starters", [])
         except httpx.HTTPStatusError as e:
@@ -18,14 +18,23 @@ import base64
 import hashlib
 import json
 import logging
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
-_conn: Optional[sqlite3.Connection] = None
+# One writer (serialised by _write_lock) plus a pool of read-only connections;
+# with WAL, get_session never waits on a write in progress
+READ_POOL_SIZE = 4
+
+_writer: Optional[sqlite3.Connection] = None
+_write_lock = threading.Lock()
+_readers: Optional[queue.Queue] = None  # None: in-memory DB, reads use the writer
 _fernet = None  # cryptography.fernet.Fernet instance or None
 
 
@@ -69,12 +78,27 @@ def _decrypt(stored: str) -> str:
 # ── DB init ───────────────────────────────────────────────────────────────────
 
 def init_db(path: str, secret: str = "") -> None:
-    """Open (or create) the SQLite database, ensure schema exists, init encryption."""
-    global _conn
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    _conn = sqlite3.connect(path, check_same_thread=False)
-    _conn.row_factory = sqlite3.Row
-    _conn.execute("""
+    """
+    Open (or create) the SQLite database, ensure schema exists, init encryption.
+    Opens the single write connection and, for file databases, the read pool.
+    """
+    global _writer, _readers
+    in_memory = path == ":memory:"
+    if not in_memory:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+    # isolation_level=None: writes use explicit BEGIN IMMEDIATE ... COMMIT
+    _writer = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    _writer.row_factory = sqlite3.Row
+    # WAL (file databases only): readers don't wait on upsert_session writes,
+    # and NORMAL sync fsyncs at checkpoints instead of on every commit
+    if not in_memory:
+        _writer.execute("PRAGMA journal_mode=WAL")
+        _writer.execute("PRAGMA synchronous=NORMAL")
+    _writer.execute("PRAGMA busy_timeout=5000")
+    _writer.execute("PRAGMA temp_store=MEMORY")
+    _writer.execute("PRAGMA cache_size=-20000")  # ~20 MB
+    _writer.execute("PRAGMA foreign_keys=ON")
+    _writer.execute("""
         CREATE TABLE IF NOT EXISTS sessions (
             chat_id    TEXT PRIMARY KEY,
             token      TEXT,
@@ -83,14 +107,52 @@ def init_db(path: str, secret: str = "") -> None:
             updated_at TEXT NOT NULL
         )
     """)
-    _conn.commit()
+
+    _readers = None
+    if not in_memory:
+        uri = Path(path).resolve().as_uri() + "?mode=ro"
+        _readers = queue.Queue()
+        for _ in range(READ_POOL_SIZE):
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA busy_timeout=5000")
+            _readers.put(conn)
     _init_encryption(secret)
 
 
 def _db() -> sqlite3.Connection:
-    if _conn is None:
+    """Return the write connection (callers hold ``_write_lock``)."""
+    if _writer is None:
         raise RuntimeError("auth.init_db() has not been called")
-    return _conn
+    return _writer
+
+
+@contextmanager
+def _reader() -> Iterator[sqlite3.Connection]:
+    """Borrow a read-only connection from the pool for the duration of the block."""
+    if _readers is None:
+        # In-memory database: only the writer's connection can see it
+        with _write_lock:
+            yield _db()
+        return
+    conn = _readers.get()
+    try:
+        yield conn
+    finally:
+        _readers.put(conn)
+
+
+def _write(sql: str, params) -> None:
+    """Run one write statement in its own IMMEDIATE transaction."""
+    with _write_lock:
+        conn = _db()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(sql, params)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
 
 def _now() -> str:
@@ -99,9 +161,8 @@ def _now() -> str:
 
 # ── Public API ─────────────────────────────────────────────────────────────────
 
-def get_session(chat_id: str) -> Optional[dict]:
-    """Return the session dict for *chat_id*, or None. Token is decrypted."""
-    row = _db().execute(
+def _fetch_session(conn: sqlite3.Connection, chat_id: str) -> Optional[dict]:
+    row = conn.execute(
         "SELECT chat_id, token, state, history, updated_at FROM sessions WHERE chat_id = ?",
         (chat_id,),
     ).fetchone()
@@ -116,6 +177,12 @@ def get_session(chat_id: str) -> Optional[dict]:
     }
 
 
+def get_session(chat_id: str) -> Optional[dict]:
+    """Return the session dict for *chat_id*, or None. Token is decrypted."""
+    with _reader() as conn:
+        return _fetch_session(conn, chat_id)
+
+
 def upsert_session(
     chat_id: str,
     *,
@@ -128,34 +195,46 @@ def upsert_session(
     Only provided keyword arguments are updated; omitted ones keep existing values.
     Returns the final session dict (token decrypted).
     """
-    existing = get_session(chat_id)
     encrypted_token = _encrypt(token) if token is not None else None
 
-    if existing is None:
-        _db().execute(
-            "INSERT INTO sessions (chat_id, token, state, history, updated_at) VALUES (?, ?, ?, ?, ?)",
-            (chat_id, encrypted_token, state or "needs_token", json.dumps(history or []), _now()),
-        )
-    else:
-        updates: dict = {"updated_at": _now()}
-        if token is not None:
-            updates["token"] = encrypted_token
-        if state is not None:
-            updates["state"] = state
-        if history is not None:
-            updates["history"] = json.dumps(history)
-
-        set_clause = ", ".join(f"{k} = ?" for k in updates)
-        _db().execute(
-            f"UPDATE sessions SET {set_clause} WHERE chat_id = ?",
-            list(updates.values()) + [chat_id],
-        )
-
-    _db().commit()
-    return get_session(chat_id)  # type: ignore[return-value]
+    # Read-modify-write on the writer inside one IMMEDIATE transaction, so
+    # concurrent upserts for the same chat can't interleave
+    with _write_lock:
+        conn = _db()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            existing = conn.execute(
+                "SELECT 1 FROM sessions WHERE chat_id = ?", (chat_id,)
+            ).fetchone()
+
+            if existing is None:
+                conn.execute(
+                    "INSERT INTO sessions (chat_id, token, state, history, updated_at) VALUES (?, ?, ?, ?, ?)",
+                    (chat_id, encrypted_token, state or "needs_token", json.dumps(history or []), _now()),
+                )
+            else:
+                updates: dict = {"updated_at": _now()}
+                if token is not None:
+                    updates["token"] = encrypted_token
+                if state is not None:
+                    updates["state"] = state
+                if history is not None:
+                    updates["history"] = json.dumps(history)
+
+                set_clause = ", ".join(f"{k} = ?" for k in updates)
+                conn.execute(
+                    f"UPDATE sessions SET {set_clause} WHERE chat_id = ?",
+                    list(updates.values()) + [chat_id],
+                )
+
+            session = _fetch_session(conn, chat_id)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    return session  # type: ignore[return-value]
 
 
 def clear_session(chat_id: str) -> None:
     """Delete the session for *chat_id* entirely."""
-    _db().execute("DELETE FROM sessions WHERE chat_id = ?", (chat_id,))
-    _db().commit()
+    _write("DELETE FROM sessions WHERE chat_id = ?", (chat_id,))
@@ -39,7 +39,7 @@ Config (config.tech.yaml → chat: section)
   ollama_url:           Ollama base URL    (default http://localhost:11434)
   db_path:              SQLite path        (default data/proxy.db)
   # meMCP URL is derived from server.port; override via MEMCP_URL env var
-  rate_limit_per_minute: max msgs/chat_id  (default 20)
+  rate_limit_per_minute: max msgs/chat_id  (default 20; 0 = unlimited)
   max_history:          conversation turns (default 10)
   max_input_chars / max_output_chars: truncation limits
 
@@ -51,11 +51,14 @@ Secrets (.env)
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import threading
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
@@ -104,6 +107,9 @@ MAX_IN      = int(_CFG.get("max_input_chars", 2000))
 MAX_OUT     = int(_CFG.get("max_output_chars", 3000))
 RATE_LIMIT  = int(_CFG.get("rate_limit_per_minute", 20))
 MAX_ROUNDS  = 5
+# Replies are cut to MAX_OUT chars anyway, so don't pay for tokens past that
+# (~4 chars per token). Floor keeps room for tool-call arguments.
+MAX_TOKENS  = max(256, min(1000, 4 + MAX_OUT // 4))
 
 # MEMCP_URL: derived from server.port so there's no duplication in config.
 # Override at runtime via MEMCP_URL env var for non-local deployments.
@@ -147,8 +153,11 @@ _rate_windows: dict[str, list[float]] = defaultdict(list)
 def _is_rate_limited(chat_id: str) -> bool:
     """
     Return True if *chat_id* has exceeded RATE_LIMIT messages in the last 60 s.
-    Removes expired timestamps as a side effect.
+    Removes expired timestamps as a side effect. RATE_LIMIT <= 0 disables the
+    limit and skips the window bookkeeping entirely.
     """
+    if RATE_LIMIT <= 0:
+        return False
     now = time.monotonic()
     window = _rate_windows[chat_id]
     window[:] = [t for t in window if now - t < 60.0]
@@ -158,8 +167,32 @@ def _is_rate_limited(chat_id: str) -> bool:
     return False
 
 
+# ── HTTP clients ─────────────────────────────────────────────────────────────
+# Shared so calls reuse keep-alive connections instead of a new TCP (and TLS)
+# handshake each time. The async meMCP client is opened in lifespan; per-call
+# timeouts are passed with each request.
+
+_ollama_http = httpx.Client(timeout=60)
+_memcp_http: Optional[httpx.AsyncClient] = None
+
+
+def _memcp() -> httpx.AsyncClient:
+    if _memcp_http is None:
+        raise RuntimeError("meMCP HTTP client is not open (lifespan has not run)")
+    return _memcp_http
+
+
 # ── LLM client ───────────────────────────────────────────────────────────────
 
+# Completions keyed on (backend, model, messages, tools). Identical turns —
+# typically the starter questions on a fresh session — are answered from
+# here instead of another paid model round-trip. LRU-bounded, short TTL.
+COMPLETION_TTL       = 900.0
+COMPLETION_CACHE_MAX = 256
+_completion_cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+_completion_lock = threading.Lock()
+
+
 class _LLMClient:
     """Thin abstraction over Groq and Ollama (OpenAI-compatible) backends."""
 
@@ -167,26 +200,50 @@ class _LLMClient:
         self.host = LLM_HOST
         self.model = LLM_MODEL
         self._groq = None
+        self._groq_lock = threading.Lock()
 
     def _get_groq(self):
+        # Completions run in worker threads; double-checked so concurrent
+        # first calls build a single client (and connection pool)
         if self._groq is None:
-            if not GROQ_KEY:
-                raise RuntimeError(
-                    "GROQ_API_KEY is not set. "
-                    "Add it to connectors/.env or set it as an environment variable."
-                )
-            import groq as groq_sdk
-            self._groq = groq_sdk.Groq(api_key=GROQ_KEY)
+            with self._groq_lock:
+                if self._groq is None:
+                    if not GROQ_KEY:
+                        raise RuntimeError(
+                            "GROQ_API_KEY is not set. "
+                            "Add it to connectors/.env or set it as an environment variable."
+                        )
+                    import groq as groq_sdk
+                    self._groq = groq_sdk.Groq(api_key=GROQ_KEY)
         return self._groq
 
     def complete(self, messages: list[dict], tools: Optional[list[dict]] = None) -> dict:
+        key = hashlib.blake2b(
+            json.dumps([self.host, self.model, messages, tools], ensure_ascii=False).encode(),
+            digest_size=16,
+        ).digest()
+        now = time.monotonic()
+        with _completion_lock:
+            hit = _completion_cache.get(key)
+            if hit and now - hit[0] < COMPLETION_TTL:
+                _completion_cache.move_to_end(key)
+                return hit[1]
+
         if self.host == "groq":
-            return self._complete_groq(messages, tools)
-        return self._complete_ollama(messages, tools)
+            result = self._complete_groq(messages, tools)
+        else:
+            result = self._complete_ollama(messages, tools)
+
+        with _completion_lock:
+            _completion_cache[key] = (now, result)
+            _completion_cache.move_to_end(key)
+            while len(_completion_cache) > COMPLETION_CACHE_MAX:
+                _completion_cache.popitem(last=False)  # evict least recently used
+        return result
 
     def _complete_groq(self, messages, tools):
         groq = self._get_groq()
-        kwargs: dict = dict(model=self.model, messages=messages, temperature=0.7, max_tokens=1000)
+        kwargs: dict = dict(model=self.model, messages=messages, temperature=0.7, max_tokens=MAX_TOKENS)
         if tools:
             kwargs["tools"] = tools
             kwargs["tool_choice"] = "auto"
@@ -201,10 +258,10 @@ class _LLMClient:
         }
 
     def _complete_ollama(self, messages, tools):
-        payload: dict = {"model": self.model, "messages": messages, "stream": False, "options": {"temperature": 0.7}}
+        payload: dict = {"model": self.model, "messages": messages, "stream": False, "options": {"temperature": 0.7, "num_predict": MAX_TOKENS}}
         if tools:
             payload["tools"] = tools
-        resp = httpx.post(f"{OLLAMA_URL}/v1/chat/completions", json=payload, timeout=60)
+        resp = _ollama_http.post(f"{OLLAMA_URL}/v1/chat/completions", json=payload)
         resp.raise_for_status()
         choice = resp.json()["choices"][0]["message"]
         raw_calls = choice.get("tool_calls") or []
@@ -236,15 +293,14 @@ _groq_tools: list[dict] = []
 async def _fetch_tool_manifest() -> None:
     global _groq_tools
     try:
-        async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.get(f"{MEMCP_URL}/mcp/tools")
-            resp.raise_for_status()
-            tools = resp.json()["data"]["tools"]
-            _groq_tools = [
-                {"type": "function", "function": {"name": t["name"], "description": t["description"], "parameters": t["inputSchema"]}}
-                for t in tools
-            ]
-            logger.info("Loaded %d tools from meMCP (backend: %s/%s)", len(_groq_tools), LLM_HOST, LLM_MODEL)
+        resp = await _memcp().get(f"{MEMCP_URL}/mcp/tools", timeout=10)
+        resp.raise_for_status()
+        tools = resp.json()["data"]["tools"]
+        _groq_tools = [
+            {"type": "function", "function": {"name": t["name"], "description": t["description"], "parameters": t["inputSchema"]}}
+            for t in tools
+        ]
+        logger.info("Loaded %d tools from meMCP (backend: %s/%s)", len(_groq_tools), LLM_HOST, LLM_MODEL)
     except Exception as exc:
         logger.warning("Could not fetch meMCP tool manifest: %s", exc)
         _groq_tools = []
@@ -254,12 +310,17 @@ async def _fetch_tool_manifest() -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global _memcp_http
     logging.basicConfig(level=logging.INFO)
     if not PROXY_SECRET:
         logger.warning("PROXY_SECRET is not set — proxy accepts requests from any caller (development mode)")
     auth.init_db(DB_PATH, secret=PROXY_SECRET)
-    await _fetch_tool_manifest()
-    yield
+    async with httpx.AsyncClient() as client:
+        _memcp_http = client
+        await _fetch_tool_manifest()
+        yield
+        _memcp_http = None
+    _ollama_http.close()
 
 
 app = FastAPI(title="meMCP Chat Proxy", version="1.0.0", lifespan=lifespan)
@@ -286,19 +347,19 @@ async def _verify_token(token: str) -> dict | None:
     Returns the token info dict on success, None on failure.
     """
     try:
-        async with httpx.AsyncClient(timeout=8) as client:
-            resp = await client.get(
-                f"{MEMCP_URL}/token/info",
-                headers={"Authorization": f"Bearer {token}"},
-            )
-            if resp.status_code != 200:
-                return None
-            data = resp.json().get("data", {})
-            tier = data.get("tier", "")
-            # Accept both 'chat' (correct) and 'mcp' (backward compat during transition)
-            if tier not in ("chat", "mcp"):
-                return None
-            return data
+        resp = await _memcp().get(
+            f"{MEMCP_URL}/token/info",
+            timeout=8,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        if resp.status_code != 200:
+            return None
+        data = resp.json().get("data", {})
+        tier = data.get("tier", "")
+        # Accept both 'chat' (correct) and 'mcp' (backward compat during transition)
+        if tier not in ("chat", "mcp"):
+            return None
+        return data
     except Exception:
         return None
 
@@ -309,24 +370,24 @@ async def _derive_token(chat_token: str, chat_id: str) -> str | None:
     for MCP API calls. Returns the raw derived token or None on failure.
     """
     try:
-        async with httpx.AsyncClient(timeout=8) as client:
-            resp = await client.post(
-                f"{MEMCP_URL}/internal/tokens/derive",
-                headers={
-                    "X-Proxy-Secret": PROXY_SECRET,
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "parent_token": chat_token,
-                    "scope": "mcp_read",
-                    "ttl_minutes": 60,
-                    "chat_id": chat_id,
-                },
-            )
-            if resp.status_code != 200:
-                logger.warning("Failed to derive token: %s %s", resp.status_code, resp.text[:200])
-                return None
-            return resp.json().get("derived_token")
+        resp = await _memcp().post(
+            f"{MEMCP_URL}/internal/tokens/derive",
+            timeout=8,
+            headers={
+                "X-Proxy-Secret": PROXY_SECRET,
+                "Content-Type": "application/json",
+            },
+            json={
+                "parent_token": chat_token,
+                "scope": "mcp_read",
+                "ttl_minutes": 60,
+                "chat_id": chat_id,
+            },
+        )
+        if resp.status_code != 200:
+            logger.warning("Failed to derive token: %s %s", resp.status_code, resp.text[:200])
+            return None
+        return resp.json().get("derived_token")
     except Exception as exc:
         logger.warning("Derive token error: %s", exc)
         return None
@@ -335,32 +396,32 @@ async def _derive_token(chat_token: str, chat_id: str) -> str | None:
 async def _revoke_derived_token(derived_token: str) -> None:
     """Revoke a derived token when disconnecting."""
     try:
-        async with httpx.AsyncClient(timeout=5) as client:
-            await client.post(
-                f"{MEMCP_URL}/internal/tokens/revoke",
-                headers={
-                    "X-Proxy-Secret": PROXY_SECRET,
-                    "Content-Type": "application/json",
-                },
-                json={"derived_token": derived_token},
-            )
+        await _memcp().post(
+            f"{MEMCP_URL}/internal/tokens/revoke",
+            timeout=5,
+            headers={
+                "X-Proxy-Secret": PROXY_SECRET,
+                "Content-Type": "application/json",
+            },
+            json={"derived_token": derived_token},
+        )
     except Exception as exc:
         logger.debug("Revoke derived token error (non-critical): %s", exc)
 
 
 async def _call_tool(token: str, tool_name: str, arguments: dict) -> dict:
     try:
-        async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                f"{MEMCP_URL}/mcp/tools/call",
-                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
-                json={"tool": tool_name, "arguments": arguments},
-            )
-            if resp.status_code == 403:
-                return {"error": "access_denied", "message": "This feature requires a higher-tier token."}
-            if resp.status_code != 200:
-                return {"error": f"http_{resp.status_code}", "message": resp.text[:200]}
-            return {"result": resp.json()}
+        resp = await _memcp().post(
+            f"{MEMCP_URL}/mcp/tools/call",
+            timeout=30,
+            headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+            json={"tool": tool_name, "arguments": arguments},
+        )
+        if resp.status_code == 403:
+            return {"error": "access_denied", "message": "This feature requires a higher-tier token."}
+        if resp.status_code != 200:
+            return {"error": f"http_{resp.status_code}", "message": resp.text[:200]}
+        return {"result": resp.json()}
     except Exception as exc:
         return {"error": "network_error", "message": str(exc)}
 
@@ -373,8 +434,10 @@ async def _llm_loop(token: str, history: list[dict], user_message: str) -> tuple
     messages = [{"role": "system", "content": SYSTEM_PROMPT}] + history + [{"role": "user", "content": trimmed_input}]
     new_history = history + [{"role": "user", "content": trimmed_input}]
 
+    # The Groq SDK and Ollama calls are blocking HTTP round-trips: run them in
+    # a worker thread so other chats keep being served while the model answers
     for _ in range(MAX_ROUNDS):
-        choice = _llm.complete(messages, tools=_groq_tools or None)
+        choice = await asyncio.to_thread(_llm.complete, messages, _groq_tools or None)
 
         if not choice["tool_calls"]:
             reply = _truncate(choice["content"], MAX_OUT)
@@ -388,15 +451,22 @@ async def _llm_loop(token: str, history: list[dict], user_message: str) -> tuple
         }
         messages.append(assistant_msg)
 
+        # Tool calls of one round are independent: run them concurrently and
+        # append the results in call order
+        pending = []
         for tc in choice["tool_calls"]:
             try:
                 args = json.loads(tc["function"]["arguments"])
             except json.JSONDecodeError:
                 args = {}
-            tool_result = await _call_tool(token, tc["function"]["name"], args)
+            pending.append(_call_tool(token, tc["function"]["name"], args))
+        tool_results = await asyncio.gather(*pending)
+        for tc, tool_result in zip(choice["tool_calls"], tool_results):
             messages.append({"role": "tool", "tool_call_id": tc["id"], "content": json.dumps(tool_result, ensure_ascii=False)})
 
-    choice = _llm.complete(messages + [{"role": "user", "content": "Please summarise what you found."}])
+    choice = await asyncio.to_thread(
+        _llm.complete, messages + [{"role": "user", "content": "Please summarise what you found."}]
+    )
     reply = _truncate(choice["content"] or "I found some data — please ask me to summarise.", MAX_OUT)
     new_history.append({"role": "assistant", "content": reply})
     return reply, new_history
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 
@@ -33,7 +34,8 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     text = update.message.text or ""
     log.info("message from %s: %r", chat_id, text[:60])
     try:
-        data = call_proxy(chat_id, text)
+        # Blocking HTTP call; keep it off the event loop so other updates are served
+        data = await asyncio.to_thread(call_proxy, chat_id, text)
         reply = data["reply"]
         starters = data.get("starters", [])
     except httpx.HTTPStatusError as e:
@@ -34,6 +34,7 @@ Tag types (for technologies, skills, general tags):
 
 import sqlite3
 import json
+import queue
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
@@ -92,9 +93,13 @@ CREATE TABLE IF NOT EXISTS tags (
     tag_type  TEXT NOT NULL DEFAULT 'generic',  -- technology | skill | generic
     UNIQUE(entity_id, tag, tag_type)
 );
-CREATE INDEX IF NOT EXISTS idx_tags_type ON tags(tag_type);
+-- Covering index for every "tag_type = ? [AND tag = ?]" lookup (supersedes
+-- the old single-column idx_tags_type).
+DROP INDEX IF EXISTS idx_tags_type;
+CREATE INDEX IF NOT EXISTS idx_tags_type_tag ON tags(tag_type, tag, entity_id);
 CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag);
 CREATE INDEX IF NOT EXISTS idx_tags_entity ON tags(entity_id);
+CREATE INDEX IF NOT EXISTS idx_tags_lower ON tags(LOWER(tag));  -- case-insensitive seeks/prefix scans
 
 -- ── Translations (i18n overlay — only title + description) ────────────────────
 CREATE TABLE IF NOT EXISTS entity_translations (
@@ -163,7 +168,7 @@ CREATE TABLE IF NOT EXISTS tokens (
     max_input_chars         INTEGER,             -- override: max input chars before truncation
     max_output_chars        INTEGER              -- override: max output chars after LLM response
 );
-CREATE INDEX IF NOT EXISTS idx_tokens_value ON tokens(token_value);
+DROP INDEX IF EXISTS idx_tokens_value;  -- duplicate of the UNIQUE autoindex
 -- NOTE: idx_tokens_tier is created in _migrate_columns (column may not exist yet on older DBs)
 
 -- ── Usage logs (all-stage request tracking) ───────────────────────────────────
@@ -179,7 +184,10 @@ CREATE TABLE IF NOT EXISTS usage_logs (
     input_text      TEXT,           -- actual input text (truncated to max_input_chars for storage)
     tokens_used     INTEGER         -- LLM output tokens consumed (from API response)
 );
-CREATE INDEX IF NOT EXISTS idx_usage_token        ON usage_logs(token_id);
+-- (token_id, timestamp) serves per-token counts and "latest N for a token"
+-- listings from the index alone; it also makes a token_id-only index redundant
+CREATE INDEX IF NOT EXISTS idx_usage_date_token   ON usage_logs(token_id, timestamp);
+DROP INDEX IF EXISTS idx_usage_token;
 CREATE INDEX IF NOT EXISTS idx_usage_timestamp    ON usage_logs(timestamp);
 -- Indexes on new columns are created in _migrate_columns (safe for existing DBs)
 
@@ -194,21 +202,135 @@ CREATE TABLE IF NOT EXISTS derived_tokens (
     is_active         INTEGER DEFAULT 1,          -- 1=active, 0=revoked
     chat_id           TEXT                        -- links to the chat session that requested it
 );
-CREATE INDEX IF NOT EXISTS idx_derived_value  ON derived_tokens(token_value);
+DROP INDEX IF EXISTS idx_derived_value;  -- duplicate of the UNIQUE autoindex
 CREATE INDEX IF NOT EXISTS idx_derived_parent ON derived_tokens(parent_token_id);
 """
 
+# ── Cache epoch ─────────────────────────────────────────────────────────────
+# Single-row counter bumped by triggers on every write to the content tables,
+# from any process (ingest, admin, metrics). Readers use it as a cheap
+# cross-process "has anything changed?" key for caches and ETags.
+_EPOCH_TABLES = ("entities", "tags", "entity_translations", "greeting_translations", "tag_metrics")
+
+EPOCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_epoch (
+    id    INTEGER PRIMARY KEY CHECK (id = 1),
+    epoch INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO cache_epoch (id, epoch) VALUES (1, 0);
+""" + "".join(
+    f"CREATE TRIGGER IF NOT EXISTS epoch_{table}_{op.lower()} AFTER {op} ON {table} "
+    f"BEGIN UPDATE cache_epoch SET epoch = epoch + 1 WHERE id = 1; END;\n"
+    for table in _EPOCH_TABLES
+    for op in ("INSERT", "UPDATE", "DELETE")
+)
+
+# ── Search indexes (FTS5 trigram) ───────────────────────────────────────────
+# External-content index over tags.tag so substring lookups can use a
+# trigram match instead of a full scan with LIKE '%term%'. Kept separate
+# from SCHEMA because FTS5 is a compile-time option of the SQLite build.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tags_fts USING fts5(
+    tag, content='tags', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS tags_fts_ai AFTER INSERT ON tags BEGIN
+    INSERT INTO tags_fts(rowid, tag) VALUES (new.id, new.tag);
+END;
+CREATE TRIGGER IF NOT EXISTS tags_fts_ad AFTER DELETE ON tags BEGIN
+    INSERT INTO tags_fts(tags_fts, rowid, tag) VALUES ('delete', old.id, old.tag);
+END;
+CREATE TRIGGER IF NOT EXISTS tags_fts_au AFTER UPDATE ON tags BEGIN
+    INSERT INTO tags_fts(tags_fts, rowid, tag) VALUES ('delete', old.id, old.tag);
+    INSERT INTO tags_fts(rowid, tag) VALUES (new.id, new.tag);
+END;
+
+-- Entity search index: title, description and the entity's tags, keyed by
+-- entities.rowid. Trigram keeps the LIKE '%q%' substring semantics of the
+-- old search while using an index and bm25() ranking.
+CREATE VIRTUAL TABLE IF NOT EXISTS entities_fts USING fts5(
+    title, description, tags, tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS entities_fts_ai AFTER INSERT ON entities BEGIN
+    INSERT INTO entities_fts(rowid, title, description, tags)
+    VALUES (new.rowid, new.title, new.description, '');
+END;
+CREATE TRIGGER IF NOT EXISTS entities_fts_au AFTER UPDATE OF title, description ON entities BEGIN
+    UPDATE entities_fts SET title = new.title, description = new.description
+    WHERE rowid = new.rowid;
+END;
+CREATE TRIGGER IF NOT EXISTS entities_fts_ad AFTER DELETE ON entities BEGIN
+    DELETE FROM entities_fts WHERE rowid = old.rowid;
+END;
+CREATE TRIGGER IF NOT EXISTS entities_fts_tags_ai AFTER INSERT ON tags BEGIN
+    UPDATE entities_fts
+    SET tags = (SELECT group_concat(tag, ' ') FROM tags WHERE entity_id = new.entity_id)
+    WHERE rowid = (SELECT rowid FROM entities WHERE id = new.entity_id);
+END;
+CREATE TRIGGER IF NOT EXISTS entities_fts_tags_ad AFTER DELETE ON tags BEGIN
+    UPDATE entities_fts
+    SET tags = (SELECT group_concat(tag, ' ') FROM tags WHERE entity_id = old.entity_id)
+    WHERE rowid = (SELECT rowid FROM entities WHERE id = old.entity_id);
+END;
+"""
+
+# Full re-sync of both search indexes; run by init_db so rows written before
+# the indexes existed (or rowids moved by VACUUM) are picked up.
+FTS_REBUILD = """
+INSERT INTO tags_fts(tags_fts) VALUES ('rebuild');
+DELETE FROM entities_fts;
+INSERT INTO entities_fts(rowid, title, description, tags)
+SELECT e.rowid, e.title, e.description,
+       (SELECT group_concat(t.tag, ' ') FROM tags t WHERE t.entity_id = e.id)
+FROM entities e;
+"""
+
 
 # --- DB CONNECTION ---
 
 def get_db(path: Path = DB_PATH) -> sqlite3.Connection:
-    conn = sqlite3.connect(path, check_same_thread=False)
+    # Pooled connections live long enough for a larger statement cache to pay off
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys=ON")
     conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")    # safe with WAL, one fsync per checkpoint
+    conn.execute("PRAGMA mmap_size=268435456")   # 256 MB: serve hot pages from the OS cache
+    conn.execute("PRAGMA cache_size=-65536")     # 64 MB page cache per connection
+    conn.execute("PRAGMA temp_store=MEMORY")     # sorter / GROUP BY temp b-trees stay in RAM
     return conn
 
 
+# Idle connections kept for reuse by request handlers, per database file.
+# Opening a connection costs a file open plus the PRAGMA setup above; the
+# pool keeps up to _POOL_SIZE warm ones (with their page caches) around.
+_POOL_SIZE = 8
+_pools: dict[str, queue.SimpleQueue] = {}
+
+
+def acquire_db(path: Path = DB_PATH) -> sqlite3.Connection:
+    """Take an idle pooled connection to *path*, or open a new one."""
+    pool = _pools.setdefault(str(path), queue.SimpleQueue())
+    try:
+        return pool.get_nowait()
+    except queue.Empty:
+        return get_db(path)
+
+
+def release_db(conn: sqlite3.Connection, path: Path = DB_PATH) -> None:
+    """Return a connection from acquire_db(); closes it if the pool is full."""
+    pool = _pools.setdefault(str(path), queue.SimpleQueue())
+    try:
+        if conn.in_transaction:
+            conn.rollback()  # never hand an open transaction to the next request
+    except sqlite3.Error:
+        conn.close()
+        return
+    if pool.qsize() < _POOL_SIZE:
+        pool.put(conn)
+    else:
+        conn.close()
+
+
 def init_db(path: Path = DB_PATH):
     """Initialize database schema and run any pending column migrations."""
     conn = get_db(path)
@@ -217,6 +339,12 @@ def init_db(path: Path = DB_PATH):
     # to CREATE INDEX on a column that doesn't exist yet in an existing DB.
     _migrate_columns(conn)
     conn.executescript(SCHEMA)
+    conn.executescript(EPOCH_SCHEMA)
+    try:
+        conn.executescript(FTS_SCHEMA)
+        conn.executescript(FTS_REBUILD)
+    except sqlite3.OperationalError:
+        pass  # SQLite built without FTS5 — searches fall back to LIKE
     conn.commit()
     conn.close()
 
@@ -279,6 +407,32 @@ def _migrate_columns(conn: sqlite3.Connection) -> None:
         pass  # tokens table may not exist yet on first run
 
 
+def get_cache_epoch(conn: sqlite3.Connection) -> int:
+    """Current content epoch; changes whenever any content table is written."""
+    try:
+        row = conn.execute("SELECT epoch FROM cache_epoch WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return 0  # init_db has not run against this database yet
+    return row[0] if row else 0
+
+
+_EPOCH_KEY_SQL = """
+    SELECT (SELECT file FROM pragma_database_list WHERE name = 'main'), epoch
+    FROM cache_epoch WHERE id = 1
+"""
+
+
+def epoch_cache_key(conn: sqlite3.Connection) -> tuple:
+    """
+    (database file, content epoch) for keying in-process caches, or () when
+    the epoch table is missing — callers must not cache in that case.
+    """
+    try:
+        return tuple(conn.execute(_EPOCH_KEY_SQL).fetchone() or ())
+    except sqlite3.OperationalError:
+        return ()
+
+
 # --- ENTITY CRUD ---
 
 def now_iso() -> str:
@@ -289,6 +443,9 @@ def new_id() -> str:
     return str(uuid.uuid4())
 
 
+INSERT_TAG_SQL = "INSERT OR IGNORE INTO tags(entity_id,tag,tag_type) VALUES(?,?,?)"
+
+
 def upsert_entity(conn: sqlite3.Connection, data: dict) -> str:
     """
     Insert or update an entity. Returns the entity id.
@@ -430,30 +587,12 @@ def upsert_entity(conn: sqlite3.Connection, data: dict) -> str:
 
     # Tags: replace all
     conn.execute("DELETE FROM tags WHERE entity_id=?", (eid,))
-    
-    # Generic tags
-    for tag in data.get("tags", []):
-        if tag and tag.strip():
-            conn.execute(
-                "INSERT OR IGNORE INTO tags(entity_id,tag,tag_type) VALUES(?,?,'generic')",
-                (eid, tag.strip())
-            )
-    
-    # Technology tags
-    for tag in data.get("technologies", []):
-        if tag and tag.strip():
-            conn.execute(
-                "INSERT OR IGNORE INTO tags(entity_id,tag,tag_type) VALUES(?,?,'technology')",
-                (eid, tag.strip())
-            )
-    
-    # Skill tags
-    for tag in data.get("skills", []):
-        if tag and tag.strip():
-            conn.execute(
-                "INSERT OR IGNORE INTO tags(entity_id,tag,tag_type) VALUES(?,?,'skill')",
-                (eid, tag.strip())
-            )
+    conn.executemany(INSERT_TAG_SQL, [
+        (eid, tag.strip(), tag_type)
+        for tag_type, key in (("generic", "tags"), ("technology", "technologies"), ("skill", "skills"))
+        for tag in data.get(key, [])
+        if tag and tag.strip()
+    ])
 
     return eid
 
@@ -468,6 +607,45 @@ def get_entity(conn: sqlite3.Connection, eid: str) -> Optional[dict]:
     return _hydrate(conn, dict(row))
 
 
+_entity_flavor_cache: tuple[tuple, dict[str, str]] = ((), {})
+
+
+def get_entity_flavor(conn: sqlite3.Connection, eid: str) -> Optional[str]:
+    """
+    Flavor of entity *eid*, or None if it doesn't exist. Answered from an
+    in-process id → flavor map rebuilt only when the content epoch changes,
+    so lookups for unknown ids (404s) never touch the entities table.
+    """
+    global _entity_flavor_cache
+    key = epoch_cache_key(conn)
+    if not key:
+        row = conn.execute("SELECT flavor FROM entities WHERE id=?", (eid,)).fetchone()
+        return row[0] if row else None
+    if _entity_flavor_cache[0] != key:
+        flavors = dict(conn.execute("SELECT id, flavor FROM entities").fetchall())
+        _entity_flavor_cache = (key, flavors)
+    return _entity_flavor_cache[1].get(eid)
+
+
+# Text filter for list_entities: the entities_fts trigram index (same
+# substring semantics as search_entities), or a plain scan for short terms
+_LIST_SEARCH_FTS = "e.rowid IN (SELECT rowid FROM entities_fts WHERE entities_fts MATCH ?)"
+_LIST_SEARCH_SCAN = """(INSTR(LOWER(e.title), LOWER(?)) > 0
+         OR INSTR(LOWER(e.description), LOWER(?)) > 0
+         OR EXISTS (SELECT 1 FROM tags ts
+                    WHERE ts.entity_id = e.id AND INSTR(LOWER(ts.tag), LOWER(?)) > 0))"""
+
+
+def _list_entities_sql(tag_join: str, where: list[str]) -> str:
+    return f"""
+        SELECT DISTINCT e.* FROM entities e
+        {tag_join}
+        WHERE {' AND '.join(where)}
+        ORDER BY e.start_date DESC NULLS LAST, e.date DESC NULLS LAST, e.updated_at DESC
+        LIMIT ? OFFSET ?
+    """
+
+
 def list_entities(conn: sqlite3.Connection,
                   flavor: str = None,
                   category: str = None,
@@ -492,29 +670,31 @@ def list_entities(conn: sqlite3.Connection,
         where.append("e.source=?")
         params.append(source)
 
+    # Tag joins precede WHERE in the statement, so their values bind first
     tag_join = ""
-    if search:
-        # Search in title, description, AND tags
-        tag_join = " LEFT JOIN tags ts ON ts.entity_id=e.id"
-        where.append("(e.title LIKE ? OR e.description LIKE ? OR ts.tag LIKE ?)")
-        params.extend([f"%{search}%", f"%{search}%", f"%{search}%"])
-
+    join_params: list[Any] = []
     if tags:
         for i, tag in enumerate(tags):
             alias = f"t{i}"
             tag_join += f" JOIN tags {alias} ON {alias}.entity_id=e.id AND {alias}.tag LIKE ?"
-            params.append(f"%{tag}%")
+            join_params.append(f"%{tag}%")
 
-    sql = f"""
-        SELECT DISTINCT e.* FROM entities e
-        {tag_join}
-        WHERE {' AND '.join(where)}
-        ORDER BY e.start_date DESC NULLS LAST, e.date DESC NULLS LAST, e.updated_at DESC
-        LIMIT ? OFFSET ?
-    """
-    params.extend([limit, offset])
-    rows = conn.execute(sql, params).fetchall()
-    return [_hydrate(conn, dict(r)) for r in rows]
+    # Search in title, description, AND tags
+    if search and len(search) >= 3:
+        phrase = '"' + search.replace('"', '""') + '"'
+        try:
+            rows = conn.execute(_list_entities_sql(tag_join, [*where, _LIST_SEARCH_FTS]),
+                                [*join_params, *params, phrase, limit, offset])
+            return _hydrate_many(conn, [dict(r) for r in rows])
+        except sqlite3.OperationalError:
+            pass  # entities_fts missing — fall through to the scan
+    if search:
+        where.append(_LIST_SEARCH_SCAN)
+        params.extend([search, search, search])
+
+    rows = conn.execute(_list_entities_sql(tag_join, where),
+                        [*join_params, *params, limit, offset])
+    return _hydrate_many(conn, [dict(r) for r in rows])
 
 
 def _hydrate(conn: sqlite3.Connection, row: dict) -> dict:
@@ -523,14 +703,18 @@ def _hydrate(conn: sqlite3.Connection, row: dict) -> dict:
     if not eid:
         return row
 
-    # Get tags by type
-    tags_raw = conn.execute(
+    # Get tags by type, bucketed in one pass over (tag, tag_type) tuples
+    buckets: dict[str, list[str]] = {"generic": [], "technology": [], "skill": []}
+    for tag, tag_type in conn.execute(
         "SELECT tag, tag_type FROM tags WHERE entity_id=? ORDER BY tag_type, tag", (eid,)
-    ).fetchall()
-
-    row["tags"] = [t["tag"] for t in tags_raw if t["tag_type"] == "generic"]
-    row["technologies"] = [t["tag"] for t in tags_raw if t["tag_type"] == "technology"]
-    row["skills"] = [t["tag"] for t in tags_raw if t["tag_type"] == "skill"]
+    ):
+        bucket = buckets.get(tag_type)
+        if bucket is not None:
+            bucket.append(tag)
+
+    row["tags"] = buckets["generic"]
+    row["technologies"] = buckets["technology"]
+    row["skills"] = buckets["skill"]
     
     # Parse raw_data from JSON string to dict
     if row.get("raw_data"):
@@ -542,6 +726,43 @@ def _hydrate(conn: sqlite3.Connection, row: dict) -> dict:
     return row
 
 
+def _hydrate_many(conn: sqlite3.Connection, rows: list[dict]) -> list[dict]:
+    """
+    Batch form of _hydrate: one tags query for all rows (ids bound as a
+    single JSON array, so there is no host-parameter limit) instead of one
+    per entity.
+    """
+    ids = [r["id"] for r in rows if r.get("id")]
+    if not ids:
+        return rows
+
+    by_entity: dict[str, dict[str, list[str]]] = {
+        eid: {"generic": [], "technology": [], "skill": []} for eid in ids
+    }
+    for entity_id, tag, tag_type in conn.execute(
+        "SELECT entity_id, tag, tag_type FROM tags "
+        "WHERE entity_id IN (SELECT value FROM json_each(?)) "
+        "ORDER BY tag_type, tag", (json.dumps(ids),)
+    ):
+        bucket = by_entity[entity_id].get(tag_type)
+        if bucket is not None:
+            bucket.append(tag)
+
+    for row in rows:
+        tags = by_entity.get(row.get("id"))
+        if tags is None:
+            continue
+        row["tags"] = list(tags["generic"])
+        row["technologies"] = list(tags["technology"])
+        row["skills"] = list(tags["skill"])
+        if row.get("raw_data"):
+            try:
+                row["raw_data"] = json.loads(row["raw_data"])
+            except (json.JSONDecodeError, TypeError):
+                row["raw_data"] = {}
+    return rows
+
+
 # --- TRANSLATION CRUD ---
 
 SUPPORTED_LANGS = {"en", "de"}
@@ -573,6 +794,20 @@ def get_translation(conn: sqlite3.Connection,
     return dict(row) if row else None
 
 
+def get_translations(conn: sqlite3.Connection,
+                     entity_ids, lang: str) -> dict[str, dict]:
+    """Get translations for many entities in one query, keyed by entity_id."""
+    ids = list(entity_ids)
+    if not ids:
+        return {}
+    # ids bound as one JSON array: fixed statement text, no parameter limit
+    rows = conn.execute("""
+        SELECT * FROM entity_translations
+        WHERE lang=? AND entity_id IN (SELECT value FROM json_each(?))
+    """, (lang, json.dumps(ids)))
+    return {r["entity_id"]: dict(r) for r in rows}
+
+
 def needs_translation(conn: sqlite3.Connection,
                       entity_id: str, lang: str) -> bool:
     """Return True if no translation exists yet for this entity+lang."""
@@ -625,6 +860,60 @@ def get_greeting_translation(conn: sqlite3.Connection,
     return dict(row) if row else None
 
 
+_SEARCH_FTS_SQL = """
+    SELECT e.* FROM entities_fts f
+    JOIN entities e ON e.rowid = f.rowid
+    WHERE entities_fts MATCH ? AND e.visibility = 'public'{flavor}
+    ORDER BY bm25(entities_fts), e.updated_at DESC
+    LIMIT ?
+"""
+# Plain substring scan: INSTR on lower-cased text instead of LIKE '%q%' (no
+# pattern matcher per row, and '%'/'_' in the query are taken literally).
+# EXISTS instead of JOIN + DISTINCT stops at the first matching tag and
+# needs no dedup pass over entity × tag rows.
+_SEARCH_SCAN_SQL = """
+    SELECT e.* FROM entities e
+    WHERE e.visibility = 'public'
+      AND (INSTR(LOWER(e.title), LOWER(?)) > 0
+           OR INSTR(LOWER(e.description), LOWER(?)) > 0
+           OR EXISTS (SELECT 1 FROM tags t
+                      WHERE t.entity_id = e.id AND INSTR(LOWER(t.tag), LOWER(?)) > 0)){flavor}
+    ORDER BY e.updated_at DESC
+    LIMIT ?
+"""
+# Fixed statement texts (with/without flavor) so sqlite3's statement cache
+# reuses the compiled plans; every value, LIMIT included, is bound.
+_SEARCH_FTS = (_SEARCH_FTS_SQL.format(flavor=""),
+               _SEARCH_FTS_SQL.format(flavor=" AND e.flavor = ?"))
+_SEARCH_SCAN = (_SEARCH_SCAN_SQL.format(flavor=""),
+                _SEARCH_SCAN_SQL.format(flavor=" AND e.flavor = ?"))
+
+
+def search_entities(conn: sqlite3.Connection,
+                    query: str,
+                    flavor: Optional[str] = None,
+                    limit: int = 20) -> list[dict]:
+    """
+    Substring search over title, description and tags of public entities,
+    ranked by bm25() on the entities_fts trigram index. Queries shorter than
+    three characters (or SQLite without FTS5) use a substring scan instead.
+    """
+    flavor_params = [flavor] if flavor else []
+
+    if len(query) >= 3:
+        phrase = '"' + query.replace('"', '""') + '"'
+        try:
+            rows = conn.execute(_SEARCH_FTS[bool(flavor)],
+                                [phrase, *flavor_params, limit])
+            return _hydrate_many(conn, [dict(r) for r in rows])
+        except sqlite3.OperationalError:
+            pass  # entities_fts missing — fall through to the scan
+
+    rows = conn.execute(_SEARCH_SCAN[bool(flavor)],
+                        [query, query, query, *flavor_params, limit])
+    return _hydrate_many(conn, [dict(r) for r in rows])
+
+
 def list_entities_needing_translation(conn: sqlite3.Connection,
                                       lang: str,
                                       limit: int = 200) -> list[dict]:
@@ -645,6 +934,38 @@ def list_entities_needing_translation(conn: sqlite3.Connection,
 
 # --- DOMAIN QUERIES ---
 
+# Unfiltered /stages and /oeuvre timelines are the hot path (homepage, MCP
+# resources). They are cached per database file and content epoch; hits hand
+# out shallow copies so callers can overlay translations in place safely.
+_FULL_LIST_SQL = {
+    "stages": """
+        SELECT e.* FROM entities e
+        WHERE e.flavor = 'stages' AND e.visibility = 'public'
+        ORDER BY e.start_date DESC NULLS LAST, e.end_date DESC NULLS LAST
+    """,
+    "oeuvre": """
+        SELECT e.* FROM entities e
+        WHERE e.flavor = 'oeuvre' AND e.visibility = 'public'
+        ORDER BY e.date DESC NULLS LAST, e.updated_at DESC
+    """,
+}
+_full_list_cache: dict[str, tuple[tuple, tuple]] = {}
+
+
+def _query_full_list(conn: sqlite3.Connection, flavor: str) -> list[dict]:
+    """Return every public entity of *flavor*, served from the epoch cache."""
+    key = epoch_cache_key(conn)
+    cached = _full_list_cache.get(flavor)
+    if key and cached and cached[0] == key:
+        entities = cached[1]
+    else:
+        rows = conn.execute(_FULL_LIST_SQL[flavor])
+        entities = tuple(_hydrate_many(conn, [dict(r) for r in rows]))
+        if key:
+            _full_list_cache[flavor] = (key, entities)
+    return [dict(e) for e in entities]
+
+
 def query_stages(conn: sqlite3.Connection,
                  category: Optional[str] = None,
                  tag: Optional[str] = None,
@@ -655,6 +976,9 @@ def query_stages(conn: sqlite3.Connection,
     category filter: education|job
     tag/skill/technology: filter by generic tag, skill, or technology
     """
+    if not (category or tag or skill or technology):
+        return _query_full_list(conn, "stages")
+
     sql = "SELECT e.* FROM entities e"
     params = []
     
@@ -680,8 +1004,8 @@ def query_stages(conn: sqlite3.Connection,
     
     sql += " ORDER BY e.start_date DESC NULLS LAST, e.end_date DESC NULLS LAST"
 
-    rows = conn.execute(sql, params).fetchall()
-    return [_hydrate(conn, dict(r)) for r in rows]
+    rows = conn.execute(sql, params)
+    return _hydrate_many(conn, [dict(r) for r in rows])
 
 
 def query_oeuvre(conn: sqlite3.Connection,
@@ -694,6 +1018,9 @@ def query_oeuvre(conn: sqlite3.Connection,
     category filter: coding|blog_post|article|book|website
     tag/skill/technology: filter by generic tag, skill, or technology
     """
+    if not (category or tag or skill or technology):
+        return _query_full_list(conn, "oeuvre")
+
     sql = "SELECT e.* FROM entities e"
     params = []
     
@@ -719,8 +1046,51 @@ def query_oeuvre(conn: sqlite3.Connection,
     
     sql += " ORDER BY e.date DESC NULLS LAST, e.updated_at DESC"
 
-    rows = conn.execute(sql, params).fetchall()
-    return [_hydrate(conn, dict(r)) for r in rows]
+    rows = conn.execute(sql, params)
+    return _hydrate_many(conn, [dict(r) for r in rows])
+
+
+_FLAVOR_ORDER = {
+    "stages": "e.start_date DESC NULLS LAST, e.end_date DESC NULLS LAST",
+    "oeuvre": "e.date DESC NULLS LAST, e.updated_at DESC",
+}
+
+
+def query_flavor_by_term(conn: sqlite3.Connection,
+                         flavor: str,
+                         term: str,
+                         generic_term: Optional[str] = None,
+                         category: Optional[str] = None) -> list[dict]:
+    """
+    Return public stages/oeuvre entities matching *term*, taking the first
+    non-empty of: technology tag, skill tag, generic tag (*generic_term*,
+    defaults to *term*). Equivalent to calling query_stages/query_oeuvre with
+    technology=, then skill=, then tag= — but resolved in a single query.
+    """
+    sql = f"""
+        WITH matched AS (
+            SELECT entity_id,
+                   MIN(CASE tag_type WHEN 'technology' THEN 1 WHEN 'skill' THEN 2 ELSE 3 END) AS prio
+            FROM tags
+            WHERE (tag = ? AND tag_type IN ('technology', 'skill'))
+               OR (tag = ? AND tag_type = 'generic')
+            GROUP BY entity_id
+        )
+        SELECT e.*, m.prio AS _prio FROM entities e
+        JOIN matched m ON m.entity_id = e.id
+        WHERE e.flavor = ? AND e.visibility = 'public'
+        {"AND e.category = ?" if category else ""}
+        ORDER BY {_FLAVOR_ORDER[flavor]}
+    """
+    params = [term, generic_term or term, flavor]
+    if category:
+        params.append(category)
+
+    rows = [dict(r) for r in conn.execute(sql, params).fetchall()]
+    if not rows:
+        return []
+    best = min(r["_prio"] for r in rows)
+    return _hydrate_many(conn, [r for r in rows if r.pop("_prio") == best])
 
 
 def query_technologies(conn: sqlite3.Connection, category: str = None) -> list[dict]:
@@ -747,15 +1117,18 @@ def query_technologies(conn: sqlite3.Connection, category: str = None) -> list[d
     return [dict(r) for r in rows]
 
 
+_TECH_ENTITIES_SQL = """
+    SELECT DISTINCT e.* FROM entities e
+    JOIN tags t ON t.entity_id = e.id
+    WHERE t.tag_type = 'technology' AND t.tag = ? AND e.visibility = 'public'
+    ORDER BY e.start_date DESC NULLS LAST, e.date DESC NULLS LAST, e.updated_at DESC
+"""
+
+
 def query_technology_detail(conn: sqlite3.Connection, name: str) -> dict:
     """All entities that use a specific technology."""
-    rows = conn.execute("""
-        SELECT DISTINCT e.* FROM entities e
-        JOIN tags t ON t.entity_id = e.id
-        WHERE t.tag_type = 'technology' AND t.tag = ? AND e.visibility = 'public'
-        ORDER BY e.start_date DESC NULLS LAST, e.date DESC NULLS LAST, e.updated_at DESC
-    """, (name,)).fetchall()
-    entities = [_hydrate(conn, dict(r)) for r in rows]
+    rows = conn.execute(_TECH_ENTITIES_SQL, (name,))
+    entities = _hydrate_many(conn, [dict(r) for r in rows])
     
     # Check if technology itself is an entity
     tech_entity_row = conn.execute("""
@@ -778,6 +1151,26 @@ def query_technology_detail(conn: sqlite3.Connection, name: str) -> dict:
     }
 
 
+def query_technology_bundle(conn: sqlite3.Connection, name: str) -> dict:
+    """
+    Metrics plus using entities (grouped by flavor) for one technology —
+    what the get_technology_metrics MCP tool returns. Skips the tech_entity
+    lookup of query_technology_detail, which that tool does not use.
+    """
+    rows = conn.execute(_TECH_ENTITIES_SQL, (name,))
+    entities = _hydrate_many(conn, [dict(r) for r in rows])
+
+    grouped: dict[str, list] = {}
+    for e in entities:
+        grouped.setdefault(e["flavor"], []).append(e)
+
+    return {
+        "metrics": get_tag_metrics(conn, name, "technology"),
+        "entity_count": len(entities),
+        "by_flavor": grouped,
+    }
+
+
 def query_skills(conn: sqlite3.Connection) -> list[dict]:
     """
     Return all distinct skill tags with entity counts.
@@ -801,8 +1194,8 @@ def query_skill_detail(conn: sqlite3.Connection, skill: str) -> dict:
         JOIN tags t ON t.entity_id = e.id
         WHERE t.tag_type = 'skill' AND t.tag = ? AND e.visibility = 'public'
         ORDER BY e.start_date DESC NULLS LAST, e.date DESC NULLS LAST, e.updated_at DESC
-    """, (skill,)).fetchall()
-    entities = [_hydrate(conn, dict(r)) for r in rows]
+    """, (skill,))
+    entities = _hydrate_many(conn, [dict(r) for r in rows])
     
     grouped: dict[str, list] = {}
     for e in entities:
@@ -823,8 +1216,8 @@ def query_tag_detail(conn: sqlite3.Connection, tag_name: str) -> dict:
         JOIN tags t ON t.entity_id = e.id
         WHERE t.tag_type = 'generic' AND t.tag = ? AND e.visibility = 'public'
         ORDER BY e.start_date DESC NULLS LAST, e.date DESC NULLS LAST, e.updated_at DESC
-    """, (tag_name,)).fetchall()
-    entities = [_hydrate(conn, dict(r)) for r in rows]
+    """, (tag_name,))
+    entities = _hydrate_many(conn, [dict(r) for r in rows])
     
     grouped: dict[str, list] = {}
     for e in entities:
@@ -982,31 +1375,27 @@ def list_tag_metrics(conn: sqlite3.Connection,
         sql += " LIMIT ?"
         params.append(limit)
     
-    rows = conn.execute(sql, params).fetchall()
-    
-    metrics_list = []
-    for row in rows:
-        metrics = dict(row)
-        
+    metrics_list = [dict(row) for row in conn.execute(sql, params)]
+    for metrics in metrics_list:
         # Parse JSON distribution field
         if metrics.get("distribution"):
             try:
-                import json
                 metrics["distribution"] = json.loads(metrics["distribution"])
             except (ValueError, TypeError):
                 metrics["distribution"] = {}
-        
-        metrics_list.append(metrics)
-    
+
     return metrics_list
 
 
 def query_skills_with_metrics(conn: sqlite3.Connection,
                               order_by: str = "relevance_score",
-                              limit: int = 100) -> list[dict]:
+                              limit: int = 100,
+                              min_proficiency: Optional[float] = None) -> list[dict]:
     """
     Query all skills with their metrics.
     Combines tag counts with calculated metrics.
+    min_proficiency is applied before LIMIT, so the result is the top
+    `limit` skills that qualify.
     """
     sql = """
         SELECT 
@@ -1024,8 +1413,12 @@ def query_skills_with_metrics(conn: sqlite3.Connection,
         JOIN entities e ON e.id = t.entity_id
         LEFT JOIN tag_metrics m ON m.tag_name = t.tag AND m.tag_type = t.tag_type
         WHERE t.tag_type = 'skill' AND e.visibility = 'public'
-        GROUP BY t.tag
     """
+    params = []
+    if min_proficiency is not None:
+        sql += " AND m.proficiency >= ?"
+        params.append(min_proficiency)
+    sql += " GROUP BY t.tag"
     
     valid_order_fields = {
         "relevance_score", "proficiency", "entity_count",
@@ -1040,22 +1433,15 @@ def query_skills_with_metrics(conn: sqlite3.Connection,
     if limit:
         sql += f" LIMIT {limit}"
     
-    rows = conn.execute(sql).fetchall()
-    
-    results = []
-    for row in rows:
-        result = dict(row)
-        
+    results = [dict(row) for row in conn.execute(sql, params)]
+    for result in results:
         # Parse JSON distribution field
         if result.get("distribution"):
             try:
-                import json
                 result["distribution"] = json.loads(result["distribution"])
             except (ValueError, TypeError):
                 result["distribution"] = {}
-        
-        results.append(result)
-    
+
     return results
 
 
@@ -1105,21 +1491,14 @@ def query_technologies_with_metrics(conn: sqlite3.Connection,
     if limit:
         sql += f" LIMIT {limit}"
     
-    rows = conn.execute(sql, params).fetchall()
-    
-    results = []
-    for row in rows:
-        result = dict(row)
-        
+    results = [dict(row) for row in conn.execute(sql, params)]
+    for result in results:
         # Parse JSON distribution field
         if result.get("distribution"):
             try:
-                import json
                 result["distribution"] = json.loads(result["distribution"])
             except (ValueError, TypeError):
                 result["distribution"] = {}
-        
-        results.append(result)
-    
+
     return results
 
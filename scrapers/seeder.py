@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import Optional, Dict, List
 
 from db.models import (
-    DB_PATH, get_db, init_db, upsert_entity
+    DB_PATH, INSERT_TAG_SQL, get_db, init_db, upsert_entity
 )
 from llm.enricher import LLMEnricher
 from scrapers.yaml_sync import (
@@ -351,18 +351,15 @@ class Seeder:
             )
 
             # Update tags in DB
-            for tag_type, tags in [
-                ("technology", enrichment.get("technologies", [])),
-                ("skill", enrichment.get("skills", [])),
-                ("generic", enrichment.get("tags", []))
-            ]:
-                for tag in tags:
-                    normalized = norm_tag(tag)
-                    conn.execute(
-                        """INSERT OR IGNORE INTO tags (entity_id, tag, tag_type) 
-                           VALUES (?, ?, ?)""",
-                        (entity_id, normalized, tag_type)
-                    )
+            conn.executemany(INSERT_TAG_SQL, [
+                (entity_id, norm_tag(tag), tag_type)
+                for tag_type, tags in [
+                    ("technology", enrichment.get("technologies", [])),
+                    ("skill", enrichment.get("skills", [])),
+                    ("generic", enrichment.get("tags", []))
+                ]
+                for tag in tags
+            ])
 
             conn.commit()
             log.info(f"Enriched entity: {entity.get('title')} ({entity_id[:8]})")
@@ -0,0 +1,137 @@
+# DB Model Tests
+# Tests for the SQLite data layer and the MCP tag normalisation built on it
+# Dependent files: db/models.py, app/mcp_tools.py
+
+import pytest
+
+from db.models import (
+    get_db, init_db, upsert_entity, upsert_translation, get_translations,
+    query_stages, query_flavor_by_term, search_entities, list_entities,
+)
+from app.mcp_tools import execute_tool_batch, normalize_search_term
+
+
+@pytest.fixture
+def conn(tmp_path):
+    path = tmp_path / "profile.db"
+    init_db(path)
+    c = get_db(path)
+    yield c
+    c.close()
+
+
+@pytest.fixture
+def entity_ids(conn):
+    ids = [
+        upsert_entity(conn, {
+            "flavor": "stages", "category": "job", "title": "Data Engineer",
+            "source": "manual", "technologies": ["Python", "Docker"],
+            "skills": ["Data Analytics"], "tags": ["Analytics", " "],
+        }),
+        upsert_entity(conn, {
+            "flavor": "oeuvre", "category": "coding", "title": "meMCP",
+            "source": "github", "url": "https://github.com/x/memcp",
+            "technologies": ["Python", "FastAPI"],
+        }),
+    ]
+    conn.commit()
+    return ids
+
+
+def test_upsert_entity_writes_all_tag_types(conn, entity_ids):
+    rows = conn.execute(
+        "SELECT tag, tag_type FROM tags WHERE entity_id=? ORDER BY tag", (entity_ids[0],)
+    ).fetchall()
+    assert [(r["tag"], r["tag_type"]) for r in rows] == [
+        ("Analytics", "generic"),
+        ("Data Analytics", "skill"),
+        ("Docker", "technology"),
+        ("Python", "technology"),
+    ]
+
+
+def test_normalize_search_term_exact_and_partial(conn, entity_ids):
+    assert normalize_search_term("python", conn) == "Python"
+    assert normalize_search_term("ytho", conn) == "Python"        # trigram index
+    assert normalize_search_term("ock", conn) == "Docker"
+    assert normalize_search_term("Fa", conn) == "FastAPI"         # short term → LIKE
+    assert normalize_search_term("dckr", conn) == "Docker"        # subsequence
+    assert normalize_search_term("cobol", conn) == "cobol"
+
+
+def test_tag_index_follows_tag_rewrites(conn, entity_ids):
+    upsert_entity(conn, {
+        "flavor": "oeuvre", "category": "coding", "title": "meMCP",
+        "source": "github", "url": "https://github.com/x/memcp",
+        "technologies": ["Rust"],
+    })
+    conn.commit()
+    assert normalize_search_term("astap", conn) == "astap"
+    assert normalize_search_term("rus", conn) == "Rust"
+
+
+def test_get_translations_batches_lookup(conn, entity_ids):
+    upsert_translation(conn, entity_ids[0], "de", title="Dateningenieur")
+    conn.commit()
+    translations = get_translations(conn, entity_ids, "de")
+    assert list(translations) == [entity_ids[0]]
+    assert translations[entity_ids[0]]["title"] == "Dateningenieur"
+    assert get_translations(conn, [], "de") == {}
+
+
+def test_unfiltered_stages_cache_tracks_writes(conn, entity_ids):
+    first = query_stages(conn)
+    first[0]["title"] = "mutated by caller"
+    assert query_stages(conn)[0]["title"] == "Data Engineer"
+
+    conn.execute("UPDATE entities SET title = 'Lead Data Engineer' WHERE id = ?", (entity_ids[0],))
+    conn.commit()
+    assert query_stages(conn)[0]["title"] == "Lead Data Engineer"
+
+
+def test_query_flavor_by_term_matches_tag_cascade(conn, entity_ids):
+    def cascade(term):
+        return (query_stages(conn, technology=term)
+                or query_stages(conn, skill=term)
+                or query_stages(conn, tag=term))
+
+    for term in ("Python", "Data Analytics", "Analytics", "FastAPI", "nothing"):
+        expected = [e["id"] for e in cascade(term)]
+        assert [e["id"] for e in query_flavor_by_term(conn, "stages", term)] == expected
+
+
+def test_search_entities_follows_entity_and_tag_writes(conn, entity_ids):
+    assert [e["id"] for e in search_entities(conn, "fastapi")] == [entity_ids[1]]
+    assert [e["id"] for e in search_entities(conn, "ngineer", flavor="oeuvre")] == []
+
+    upsert_entity(conn, {
+        "flavor": "oeuvre", "category": "coding", "title": "meMCP",
+        "source": "github", "url": "https://github.com/x/memcp",
+        "technologies": ["Rust"],
+    })
+    conn.commit()
+    assert search_entities(conn, "fastapi") == []
+    assert [e["id"] for e in search_entities(conn, "rus")] == [entity_ids[1]]
+    assert [e["id"] for e in search_entities(conn, "Do")] == [entity_ids[0]]   # short → scan
+
+
+def test_list_entities_search_and_tag_filters(conn, entity_ids):
+    def ids(**kw):
+        return [e["id"] for e in list_entities(conn, **kw)]
+
+    assert ids(search="ngineer") == [entity_ids[0]]                  # title, via FTS
+    assert ids(search="fastapi") == [entity_ids[1]]                  # tag, via FTS
+    assert ids(search="Do") == [entity_ids[0]]                       # short → scan
+    assert ids(flavor="oeuvre", tags=["Fast"]) == [entity_ids[1]]
+    assert ids(flavor="stages", tags=["Python"], search="dock") == [entity_ids[0]]
+
+
+def test_execute_tool_batch_reports_invalid_calls_per_call(conn, entity_ids):
+    results = execute_tool_batch(conn, [
+        {"tool": "search_entities", "arguments": ["a"]},
+        {"tool": "no_such_tool", "arguments": {}},
+        {"tool": "search_entities", "arguments": {"query": "fastapi"}},
+    ])
+    assert [r["result"].get("status") for r in results[:2]] == ["error", "error"]
+    assert results[0]["result"]["error"]["code"] == 400
+    assert [e["id"] for e in results[2]["result"]["data"]["results"]] == [entity_ids[1]]